@@ -4,20 +4,20 @@ IT Stability & Operations Health Monitor
 Main application entry point
 """
 
-import tkinter as tk
-from tkinter import messagebox
 import sys
 import os
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from stability_monitor.controllers.app_controller import AppController
-from stability_monitor.config.settings import Settings
-
 def main():
     """Main application entry point"""
     try:
+        # Deferred so the GUI and analysis stack only load when actually launching
+        import tkinter as tk
+        from stability_monitor.controllers.app_controller import AppController
+        from stability_monitor.config.settings import Settings
+        
         # Initialize settings
         settings = Settings()
         
@@ -34,6 +34,7 @@ def main():
         root.mainloop()
         
     except Exception as e:
+        from tkinter import messagebox
         messagebox.showerror("Startup Error", f"Failed to start application:\n{str(e)}")
         sys.exit(1)
 
@@ -2,108 +2,228 @@
 Application settings and configuration management
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module is used instead
+    orjson = None
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, preferring orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+# Parsed user settings files keyed by absolute path: (mtime_ns, parsed settings)
+_USER_SETTINGS_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Dot-notation paths already split into key tuples, shared across instances
+_PATH_CACHE: Dict[str, Tuple[str, ...]] = {}
+
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation path into a key tuple, reusing earlier splits"""
+    try:
+        return _PATH_CACHE[key_path]
+    except KeyError:
+        keys = _PATH_CACHE[key_path] = tuple(key_path.split('.'))
+        return keys
+
+def _flatten(tree: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> Dict[Tuple[str, ...], Any]:
+    """Flatten nested settings into a single dict keyed by key tuples, so keys may contain dots"""
+    flat = {}
+    for key, value in tree.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+def _deep_merge(target: Dict[str, Any], overrides: Dict[str, Any]):
+    """Merge overrides into target in place, keeping keys the overrides leave out"""
+    for key, value in overrides.items():
+        current = target.get(key)
+        if value is current:
+            continue
+        if isinstance(value, dict) and isinstance(current, dict):
+            _deep_merge(current, value)
+        else:
+            target[key] = value
+
+def _unflatten(flat: Dict[Tuple[str, ...], Any]) -> Dict[str, Any]:
+    """Rebuild nested settings from a dict keyed by key tuples"""
+    tree = {}
+    for keys, value in flat.items():
+        node = tree
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+    return tree
+
+# Built once at import; instances copy the list-valued defaults rather than sharing them
+_DEFAULT_SETTINGS: Dict[str, Any] = {
+    "ui": {
+        "window_width": 1200,
+        "window_height": 800,
+        "theme": "default"
+    },
+    "data": {
+        "auto_detect_columns": True,
+        "date_formats": [
+            "%m/%d/%Y %H:%M",
+            "%Y-%m-%d %H:%M:%S",
+            "%m/%d/%Y",
+            "%Y-%m-%d"
+        ],
+        "required_columns": ["Site", "Priority", "Created", "Company"],
+        "optional_columns": ["Number", "Short description", "Category", "Subcategory", "Resolved"],
+        "cache_dir": "config/cache"
+    },
+    "reports": {
+        "critical_threshold": 2,
+        "mttr_targets": {
+            "1 - Critical": 4,  # hours
+            "2 - High": 24,
+            "3 - Medium": 72,
+            "4 - Low": 168
+        },
+        "date_presets": [
+            "Last 7 days",
+            "Last 30 days", 
+            "Last 90 days",
+            "Year to Date",
+            "Custom"
+        ]
+    },
+    "export": {
+        "default_format": "csv",
+        "include_filters_in_export": True,
+        "timestamp_exports": True
+    }
+}
+
+_DEFAULT_FLAT = _flatten(_DEFAULT_SETTINGS)
 
 class Settings:
     """Manages application settings and configuration"""
     
+    __slots__ = ("config_file", "_flat", "_get_cache")
+    
     def __init__(self):
         self.config_file = "config/app_settings.json"
-        self.settings = self._load_default_settings()
+        # Leaf values keyed by key tuple; the nested form is only built on demand.
+        # Lists are copied so one instance's edits never reach another's defaults.
+        self._flat = {
+            path: list(value) if isinstance(value, list) else value
+            for path, value in _DEFAULT_FLAT.items()
+        }
+        self._get_cache: Dict[Tuple[str, ...], Any] = {}
         self._load_user_settings()
     
-    def _load_default_settings(self) -> Dict[str, Any]:
-        """Load default application settings"""
-        return {
-            "ui": {
-                "window_width": 1200,
-                "window_height": 800,
-                "theme": "default"
-            },
-            "data": {
-                "auto_detect_columns": True,
-                "date_formats": [
-                    "%m/%d/%Y %H:%M",
-                    "%Y-%m-%d %H:%M:%S",
-                    "%m/%d/%Y",
-                    "%Y-%m-%d"
-                ],
-                "required_columns": ["Site", "Priority", "Created", "Company"],
-                "optional_columns": ["Number", "Short description", "Category", "Subcategory", "Resolved"]
-            },
-            "reports": {
-                "critical_threshold": 2,
-                "mttr_targets": {
-                    "1 - Critical": 4,  # hours
-                    "2 - High": 24,
-                    "3 - Medium": 72,
-                    "4 - Low": 168
-                },
-                "date_presets": [
-                    "Last 7 days",
-                    "Last 30 days", 
-                    "Last 90 days",
-                    "Year to Date",
-                    "Custom"
-                ]
-            },
-            "export": {
-                "default_format": "csv",
-                "include_filters_in_export": True,
-                "timestamp_exports": True
-            }
-        }
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Nested copy of the current settings"""
+        return _unflatten(self._flat)
     
     def _load_user_settings(self):
         """Load user-specific settings from file"""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    user_settings = json.load(f)
-                self._merge_settings(user_settings)
-            except Exception as e:
-                print(f"Warning: Could not load user settings: {e}")
+        try:
+            user_settings = self._read_user_settings()
+            self._merge_settings(user_settings)
+        except FileNotFoundError:
+            pass  # No user settings saved yet
+        except Exception as e:
+            print(f"Warning: Could not load user settings: {e}")
+    
+    def _read_user_settings(self) -> Dict[str, Any]:
+        """Read the user settings file, reusing the parsed result while its mtime is unchanged"""
+        path = Path(self.config_file).absolute()
+        mtime = path.stat().st_mtime_ns
+        cached = _USER_SETTINGS_CACHE.get(str(path))
+        if cached is None or cached[0] != mtime:
+            cached = _USER_SETTINGS_CACHE[str(path)] = (mtime, _json_loads(path.read_bytes()))
+        # Merging may hand sub-dicts to this instance, so never share the cached copy
+        return copy.deepcopy(cached[1])
     
     def _merge_settings(self, user_settings: Dict[str, Any]):
         """Merge user settings with defaults"""
-        for key, value in user_settings.items():
-            if key in self.settings and isinstance(value, dict):
-                self.settings[key].update(value)
-            else:
-                self.settings[key] = value
+        self._get_cache.clear()
+        settings = self.settings
+        _deep_merge(settings, user_settings)
+        self._flat = _flatten(settings)
     
     def get(self, key_path: str, default=None):
         """Get setting value using dot notation (e.g., 'ui.window_width')"""
-        keys = key_path.split('.')
-        value = self.settings
+        return self.get_path(_split_path(key_path), default)
+    
+    def get_path(self, keys: Tuple[str, ...], default=None):
+        """Get setting value from a pre-split key tuple (e.g., ('ui', 'window_width'))"""
+        try:
+            return self._get_cache[keys]
+        except KeyError:
+            pass
         
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
+        try:
+            value = self._flat[keys]
+        except KeyError:
+            # Sections are assembled afresh on each call, so a caller editing the
+            # returned dict can't change what later lookups see
+            value = self._get_subtree(keys)
+            return default if value is None else value
         
+        # Only leaves are memoized; misses depend on the caller's default
+        self._get_cache[keys] = value
         return value
     
+    def _get_subtree(self, keys: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        """Assemble the nested section below keys, or None if there is none"""
+        depth = len(keys)
+        section = {path[depth:]: value for path, value in self._flat.items()
+                   if len(path) > depth and path[:depth] == keys}
+        return _unflatten(section) if section else None
+    
     def set(self, key_path: str, value: Any):
         """Set setting value using dot notation"""
-        keys = key_path.split('.')
-        target = self.settings
+        self._get_cache.clear()
+        flat = self._flat
+        keys = _split_path(key_path)
+        is_section = isinstance(value, dict) and value
         
-        for key in keys[:-1]:
-            if key not in target:
-                target[key] = {}
-            target = target[key]
+        # Common case: replacing an existing leaf with another leaf
+        if keys in flat and not is_section:
+            flat[keys] = value
+            return
+        
+        # Otherwise drop whatever the path used to hold, including leaves on
+        # parent paths that the new value would otherwise sit underneath
+        depth = len(keys)
+        for path in [path for path in flat if len(path) > depth and path[:depth] == keys]:
+            del flat[path]
+        for parent in range(1, depth):
+            flat.pop(keys[:parent], None)
         
-        target[keys[-1]] = value
+        if is_section:
+            flat.update(_flatten(value, keys))
+        else:
+            flat[keys] = value
     
     def save(self):
         """Save current settings to file"""
+        _USER_SETTINGS_CACHE.pop(str(Path(self.config_file).absolute()), None)
         try:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(_json_dumps(_unflatten(self._flat)))
         except Exception as e:
             print(f"Warning: Could not save settings: {e}")
\ No newline at end of file
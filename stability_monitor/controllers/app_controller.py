@@ -2,14 +2,80 @@
 Main application controller
 """
 
+import importlib.util
+import os
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
+from datetime import datetime
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 
-from ..models.data_manager import DataManager
+from ..models.data_manager import DataManager, LoadedData
 from ..models.report_engine import ReportEngine
 from ..views.main_window import MainWindow
+from ..utils.exporters import DataExporter
+
+# How often the Tk loop checks on background work
+_POLL_INTERVAL_MS = 50
+
+# Quiet period before a burst of filter edits is applied
+_FILTER_DEBOUNCE_MS = 150
+
+# How long a completion notice stays in the status bar
+_TOAST_MS = 3000
+
+# Number of recent filter combinations whose filtered frames are kept
+_FILTER_CACHE_SIZE = 4
+
+# File dialog type filters
+_LOAD_FILETYPES = (
+    ("CSV files", "*.csv"),
+    ("Excel files", "*.xlsx *.xls"),
+    ("All files", "*.*")
+)
+# Parquet and Feather are written with pyarrow, so they are only offered when it is installed
+_COLUMNAR_FILETYPES = (
+    ("Parquet files", "*.parquet"),
+    ("Feather files", "*.feather")
+) if importlib.util.find_spec("pyarrow") is not None else ()
+_EXPORT_FILETYPES = (
+    ("CSV files", "*.csv"),
+    ("Excel files", "*.xlsx")
+) + _COLUMNAR_FILETYPES + (("All files", "*.*"),)
+_EXCEL_FILETYPES = (("Excel files", "*.xlsx"),)
+
+# Comprehensive export report sheets, in workbook order: (sheet name, report type, progress %)
+_EXPORT_SHEETS = (
+    ("Critical Hotspots", "critical_hotspots", 20),
+    ("Site Scorecard", "site_scorecard", 30),
+    ("Green List", "green_list", 40),
+    ("Franchise Overview", "franchise_overview", 50),
+    ("Equipment Analysis", "equipment_analysis", 60),
+    ("Repeat Offenders", "repeat_offenders", 70),
+    ("Resolution Tracking", "resolution_tracking", 80),
+    ("Workload Trends", "workload_trends", 85),
+    ("All Tickets", "incident_details", 90)
+)
+
+# Reports that accept a shared context, so one export computes their common site aggregates once
+_SHARED_CONTEXT_REPORTS = frozenset(["site_scorecard", "green_list"])
+
+# Filters listed in export confirmations, in display order: (filter key, label)
+_FILTER_LABELS = (
+    ("date_from", "Date from"),
+    ("date_to", "Date to"),
+    ("priorities", "Priorities"),
+    ("company", "Company"),
+    ("site", "Site"),
+    ("category", "Category"),
+    ("subcategory", "Subcategory")
+)
+
+# Calculated columns added at load that are not part of the source data
+_INTERNAL_COLUMNS = frozenset(["Is_Critical", "Is_Resolved", "Resolution_Hours", "Days_Since_Created"])
 
 class AppController:
     """Main application controller - coordinates between models and views"""
@@ -21,6 +87,48 @@ class AppController:
         # Initialize models
         self.data_manager = DataManager(settings)
         self.report_engine = ReportEngine(settings)
+        self.exporter = DataExporter()
+        
+        # Report type -> (generator, display title)
+        engine = self.report_engine
+        self._report_dispatch = {
+            "critical_hotspots": (engine.generate_critical_hotspots_report, "Critical Incident Hotspots"),
+            "site_scorecard": (engine.generate_site_scorecard_report, "Site Stability Scorecard"),
+            "green_list": (engine.generate_green_list_report, "Green List - Stable Operations"),
+            "franchise_overview": (engine.generate_franchise_overview_report, "Franchise Performance Overview"),
+            "equipment_analysis": (engine.generate_equipment_analysis_report, "Equipment Category Analysis"),
+            "incident_details": (engine.generate_incident_details_report, "Incident Details - Individual Tickets"),
+            "repeat_offenders": (engine.generate_repeat_offenders_report, "Repeat Offenders - Recurring Issues"),
+            "resolution_tracking": (engine.generate_resolution_tracking_report, "Resolution Tracking - SLA Performance"),
+            "workload_trends": (engine.generate_workload_trends_report, "Workload Trends - Volume Patterns")
+        }
+        
+        # Rows and columns currently shown in the view, kept for direct export
+        self._last_results = None
+        
+        # Pandas work runs off the Tk thread; only the latest report may update the view.
+        # The comprehensive export builds its reports in parallel on a pool of its own,
+        # so its worker never waits on jobs queued behind it in the same pool.
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+        self._export_report_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+        self._current_future = None
+        self._report_token = 0
+        self._load_future = None
+        
+        # Recently filtered frames and their summaries keyed by filter values; shared with worker threads
+        self._filter_cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        self._filter_summaries: Dict[tuple, Dict[str, Any]] = {}
+        self._filter_cache_lock = threading.Lock()
+        
+        # Pending debounced filter summary, if any
+        self._filter_after_id = None
+        
+        # Export being written in the background, and how far a comprehensive export has got
+        self._export_future = None
+        self._export_progress = 0
+        
+        # Pending reset of a status bar notice, if any
+        self._toast_after_id = None
         
         # Initialize view
         self.main_window = MainWindow(root, settings)
@@ -46,18 +154,26 @@ class AppController:
         self.main_window.set_callback('drill_down', self._handle_drill_down)
         self.main_window.set_callback('export_filtered_data', self._handle_export_filtered_data)
         self.main_window.set_callback('export_comprehensive', self._handle_export_comprehensive)
+        self.main_window.set_callback('exit', self._handle_exit)
+    
+    def _handle_exit(self):
+        """Drop queued background work and close the application"""
+        # Jobs already running finish on their own; their results are never shown
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._export_report_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
     
     def _handle_load_data(self):
         """Handle data loading from file"""
         try:
+            if self._load_future is not None:
+                return  # A file is already being loaded
+            
             # Open file dialog
             file_path = filedialog.askopenfilename(
+                parent=self.root,
                 title="Select Ticket Data File",
-                filetypes=[
-                    ("CSV files", "*.csv"),
-                    ("Excel files", "*.xlsx *.xls"),
-                    ("All files", "*.*")
-                ]
+                filetypes=_LOAD_FILETYPES
             )
             
             if not file_path:
@@ -65,157 +181,203 @@ class AppController:
             
             # Show loading status
             self.main_window.set_status("Loading data...")
-            self.main_window.show_progress(True, 0)
-            self.root.update()
-            
-            # Load data
-            result = self.data_manager.load_file(file_path)
-            
-            # Hide progress
-            self.main_window.show_progress(False)
-            
-            if not result["valid"]:
-                # Show errors
-                error_msg = "Failed to load data:\n\n" + "\n".join(result["errors"])
-                if result["warnings"]:
-                    error_msg += "\n\nWarnings:\n" + "\n".join(result["warnings"])
-                messagebox.showerror("Data Load Error", error_msg)
-                self.main_window.set_status("Failed to load data")
-                return
-            
-            # Show warnings if any
-            if result["warnings"]:
-                warning_msg = "Data loaded with warnings:\n\n" + "\n".join(result["warnings"])
-                messagebox.showwarning("Data Load Warnings", warning_msg)
+            self.main_window.show_progress(True, None)
             
-            # Update UI with loaded data
-            self._update_ui_state(data_loaded=True)
-            self._update_filter_options()
+            # Reports are unavailable until the new data is in place
+            self._supersede_report()
+            self.main_window.data_loaded(False)
             
-            # Show data summary
-            info = result["info"]
-            status_text = f"Loaded {info['processed_records']} records from {info['total_records']} total"
-            self.main_window.set_status(status_text)
-            
-            data_info = f"Sites: {info['sites']} | Companies: {info['companies']} | Categories: {info['categories']}"
-            self.main_window.update_data_info(data_info)
-            
-            # Show success message with summary
-            summary_msg = (
-                f"Data loaded successfully!\n\n"
-                f"Records processed: {info['processed_records']}\n"
-                f"Sites: {info['sites']}\n"
-                f"Companies: {info['companies']}\n"
-                f"Categories: {info['categories']}"
+            # Read and process the file on the worker thread so slow disks don't freeze the UI
+            self._load_future = self._submit(
+                lambda: self._load_data(file_path), self._data_load_finished, self._data_load_failed
             )
             
-            if info.get('date_range'):
-                date_range = info['date_range']
-                if 'Created' in date_range:
-                    created_range = date_range['Created']
-                    start_date = created_range['min'].strftime("%Y-%m-%d")
-                    end_date = created_range['max'].strftime("%Y-%m-%d")
-                    summary_msg += f"\nDate range: {start_date} to {end_date}"
-            
-            messagebox.showinfo("Data Loaded", summary_msg)
-            
         except Exception as e:
-            self.main_window.show_progress(False)
-            self.main_window.set_status("Error loading data")
-            messagebox.showerror("Error", f"Unexpected error loading data:\n{str(e)}")
+            self._data_load_failed(e)
+    
+    def _load_data(self, file_path: str):
+        """Read a file on the worker thread, reusing the processed copy if it was loaded before; the Tk thread installs it"""
+        cached = self.data_manager.read_cache(file_path)
+        if cached is not None:
+            return cached + (True,)
+        
+        result, loaded = self.data_manager.read_file(file_path)
+        if loaded is not None:
+            self.data_manager.save_to_cache(file_path, loaded, result)
+        return result, loaded, False
+    
+    def _data_load_finished(self, outcome):
+        """Install the data from a background load and show the outcome"""
+        self._load_future = None
+        result, loaded, from_cache = outcome
+        
+        warnings_block = "\n".join(result["warnings"])
+        
+        if not result["valid"]:
+            # Previously loaded data, if any, is still in place
+            self.main_window.data_loaded(self.data_manager.data is not None)
+            
+            # Show errors
+            error_parts = ["Failed to load data:", "", "\n".join(result["errors"])]
+            if warnings_block:
+                error_parts += ["", "Warnings:", warnings_block]
+            messagebox.showerror("Data Load Error", "\n".join(error_parts))
+            self.main_window.set_status("Failed to load data")
+            return
+        
+        # Results still being computed refer to the previous data set
+        self._supersede_report()
+        self._install_data(loaded)
+        
+        # Show warnings if any
+        if warnings_block:
+            messagebox.showwarning("Data Load Warnings", f"Data loaded with warnings:\n\n{warnings_block}")
+        
+        # Update UI with loaded data
+        self._update_ui_state(data_loaded=True)
+        self._update_filter_options()
+        
+        # Show data summary
+        info = result["info"]
+        status_text = f"Loaded {info['processed_records']} records from {info['total_records']} total"
+        if from_cache:
+            status_text += " (from cache)"
+        self.main_window.set_status(status_text)
+        
+        data_info = f"Sites: {info['sites']} | Companies: {info['companies']} | Categories: {info['categories']}"
+        self.main_window.update_data_info(data_info)
+        
+        # Show success message with summary
+        summary_parts = [
+            "Data loaded successfully!",
+            "",
+            f"Records processed: {info['processed_records']}",
+            f"Sites: {info['sites']}",
+            f"Companies: {info['companies']}",
+            f"Categories: {info['categories']}"
+        ]
+        
+        if info.get('date_range'):
+            date_range = info['date_range']
+            if 'Created' in date_range:
+                created_range = date_range['Created']
+                start_date = created_range['min'].strftime("%Y-%m-%d")
+                end_date = created_range['max'].strftime("%Y-%m-%d")
+                summary_parts.append(f"Date range: {start_date} to {end_date}")
+        
+        messagebox.showinfo("Data Loaded", "\n".join(summary_parts))
+    
+    def _data_load_failed(self, error: Exception):
+        """Surface an unexpected load failure"""
+        self._load_future = None
+        self.main_window.show_progress(False)
+        self.main_window.data_loaded(self.data_manager.data is not None)
+        self.main_window.set_status("Error loading data")
+        messagebox.showerror("Error", f"Unexpected error loading data:\n{str(error)}")
     
     def _handle_export_results(self):
         """Handle exporting current results"""
         try:
-            # Get current results from tree view
-            tree = self.main_window.results_tree
-            
-            if not tree.get_children():
+            if self._last_results is None:
                 messagebox.showwarning("No Data", "No results to export. Please run a report first.")
                 return
             
+            if self._export_future is not None:
+                return  # An export is already being written
+            
             # Get file path for export
-            file_path = filedialog.asksaveasfilename(
-                title="Export Results",
-                defaultextension=".csv",
-                filetypes=[
-                    ("CSV files", "*.csv"),
-                    ("Excel files", "*.xlsx"),
-                    ("All files", "*.*")
-                ]
-            )
+            file_path = self._ask_export_path("Export Results")
             
             if not file_path:
                 return
             
-            # Extract data from tree view
-            columns = [tree.heading(col)['text'] for col in tree['columns']]
-            data = []
-            for item in tree.get_children():
-                data.append(tree.item(item)['values'])
-            
-            # Create dataframe and export
-            df = pd.DataFrame(data, columns=columns)
-            
-            if file_path.lower().endswith('.csv'):
-                df.to_csv(file_path, index=False)
-            elif file_path.lower().endswith(('.xlsx', '.xls')):
-                df.to_excel(file_path, index=False)
-            else:
-                df.to_csv(file_path, index=False)  # Default to CSV
-            
-            self.main_window.set_status(f"Results exported to {file_path}")
-            messagebox.showinfo("Export Complete", f"Results exported successfully to:\n{file_path}")
+            # Export the report rows directly instead of reading back from the tree view
+            results = self._last_results
+            self._submit_export(
+                lambda: self.exporter.export(self._results_frame(results), file_path),
+                lambda _: self._results_exported("Results", file_path),
+                "Failed to export results"
+            )
             
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export results:\n{str(e)}")
     
+    def _ask_export_path(self, title: str, filetypes: tuple = _EXPORT_FILETYPES) -> str:
+        """Ask where to save an export; empty if cancelled"""
+        return filedialog.asksaveasfilename(
+            parent=self.root,
+            title=title,
+            defaultextension=".csv",
+            filetypes=filetypes
+        )
+    
     def _handle_export_selected(self):
         """Handle exporting selected rows"""
         try:
-            tree = self.main_window.results_tree
-            selected_items = tree.selection()
+            selected_rows = self.main_window.get_selected_row_indices()
             
-            if not selected_items:
+            if not selected_rows or self._last_results is None:
                 messagebox.showwarning("No Selection", "Please select rows to export.")
                 return
             
+            if self._export_future is not None:
+                return  # An export is already being written
+            
             # Get file path for export
-            file_path = filedialog.asksaveasfilename(
-                title="Export Selected Results",
-                defaultextension=".csv",
-                filetypes=[
-                    ("CSV files", "*.csv"),
-                    ("Excel files", "*.xlsx"),
-                    ("All files", "*.*")
-                ]
-            )
+            file_path = self._ask_export_path("Export Selected Results")
             
             if not file_path:
                 return
             
-            # Extract selected data
-            columns = [tree.heading(col)['text'] for col in tree['columns']]
-            data = []
-            for item in selected_items:
-                data.append(tree.item(item)['values'])
-            
-            # Create dataframe and export
-            df = pd.DataFrame(data, columns=columns)
-            
-            if file_path.lower().endswith('.csv'):
-                df.to_csv(file_path, index=False)
-            elif file_path.lower().endswith(('.xlsx', '.xls')):
-                df.to_excel(file_path, index=False)
-            else:
-                df.to_csv(file_path, index=False)
-            
-            self.main_window.set_status(f"Selected results exported to {file_path}")
-            messagebox.showinfo("Export Complete", f"Selected results exported successfully to:\n{file_path}")
+            # Build a frame from just the chosen rows
+            results = self._last_results
+            self._submit_export(
+                lambda: self.exporter.export(self._results_frame(results, selected_rows), file_path),
+                lambda _: self._results_exported("Selected results", file_path),
+                "Failed to export selected results"
+            )
             
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export selected results:\n{str(e)}")
     
+    def _results_exported(self, description: str, file_path: str):
+        """Report a finished results export"""
+        self._toast(f"{description} exported to {file_path}")
+    
+    def _toast(self, message: str):
+        """Show a notice in the status bar that clears itself, without blocking like a dialog"""
+        if self._toast_after_id is not None:
+            self.root.after_cancel(self._toast_after_id)
+        self.main_window.set_status(message)
+        self._toast_after_id = self.root.after(_TOAST_MS, self._clear_toast, message)
+    
+    def _clear_toast(self, message: str):
+        """Reset the status bar unless something else has replaced the notice"""
+        self._toast_after_id = None
+        if self.main_window.get_status() == message:
+            self.main_window.set_status("Ready")
+    
+    def _submit_export(self, write: Callable[[], Any], on_done: Callable[[Any], None], failure_message: str):
+        """Write an export on a worker thread so the window stays responsive; one export runs at a time"""
+        self.main_window.set_status("Exporting...")
+        self.main_window.show_progress(True, None)
+        self._export_future = self._submit(
+            write,
+            lambda result: self._export_finished(on_done, result),
+            lambda error: self._export_failed(failure_message, error)
+        )
+    
+    def _export_finished(self, on_done: Callable[[Any], None], result: Any):
+        """Hand a finished background export to its completion handler"""
+        self._export_future = None
+        on_done(result)
+    
+    def _export_failed(self, failure_message: str, error: Exception):
+        """Surface a background export failure"""
+        self._export_future = None
+        self.main_window.set_status("Error exporting data")
+        messagebox.showerror("Export Error", f"{failure_message}:\n{str(error)}")
+    
     def _handle_refresh(self):
         """Handle data refresh"""
         if self.data_manager.data is not None:
@@ -234,80 +396,181 @@ class AppController:
             # Get current filters
             filters = self.main_window.get_current_filters()
             
-            # Apply filters to get filtered data
-            filtered_data = self.data_manager.apply_filters(filters)
-            
-            if filtered_data.empty:
-                messagebox.showwarning("No Data", "No data matches the current filters.")
-                return
-            
             self.main_window.set_status(f"Generating {report_type} report...")
-            self.main_window.show_progress(True, 50)
-            self.root.update()
+            self.main_window.show_progress(True, None)
             
-            # Generate report based on type
-            results, columns = self._generate_report(report_type, filtered_data)
+            self._start_report(report_type, filters)
             
-            self.main_window.show_progress(False)
+        except Exception as e:
+            self._report_failed(e)
+    
+    def _start_report(self, report_type: str, filters: Dict[str, Any]):
+        """Filter and generate a report on the worker thread"""
+        def work(token):
+            filtered_data = self._get_filtered(filters)
+            if filtered_data.empty or token != self._report_token:
+                return None
+            return self._generate_report(report_type, filtered_data)
+        
+        def done(report):
+            if report is None:
+                self._show_no_matching_data()
+                return
             
+            results, columns = report
             if not results:
                 messagebox.showinfo("No Results", f"No data found for {report_type} report with current filters.")
                 self.main_window.set_status("Report completed - no results")
                 return
             
             # Display results
-            report_titles = {
-                "critical_hotspots": "Critical Incident Hotspots",
-                "site_scorecard": "Site Stability Scorecard",
-                "green_list": "Green List - Stable Operations",
-                "franchise_overview": "Franchise Performance Overview",
-                "equipment_analysis": "Equipment Category Analysis",
-                "incident_details": "Incident Details - Individual Tickets",
-                "repeat_offenders": "Repeat Offenders - Recurring Issues",
-                "resolution_tracking": "Resolution Tracking - SLA Performance",
-                "workload_trends": "Workload Trends - Volume Patterns"
-            }
-            
-            title = report_titles.get(report_type, report_type.replace('_', ' ').title())
-            self.main_window.display_results(results, columns, title)
+            _, title = self._report_dispatch.get(report_type, (None, None))
+            if title is None:
+                title = report_type.replace('_', ' ').title()
+            self._display_results(results, columns, title)
             
             self.main_window.set_status(f"Report completed: {len(results)} results")
-            
+        
+        self._submit_report(work, done, self._report_failed)
+    
+    def _report_failed(self, error: Exception):
+        """Surface a report generation failure"""
+        self.main_window.show_progress(False)
+        self.main_window.set_status("Error generating report")
+        messagebox.showerror("Report Error", f"Failed to generate report:\n{str(error)}")
+    
+    def _show_no_matching_data(self):
+        """Tell the user the current filters excluded every record"""
+        messagebox.showwarning("No Data", "No data matches the current filters.")
+        self.main_window.set_status("Ready")
+    
+    def _get_filtered(self, filters: Dict[str, Any]) -> pd.DataFrame:
+        """Filtered view of the loaded data, reusing recent results for identical filters"""
+        generation = self.data_manager.generation
+        key = self._filter_key(filters)
+        
+        with self._filter_cache_lock:
+            cached = self._filter_cache.get(key)
+            if cached is not None:
+                self._filter_cache.move_to_end(key)
+                return cached
+        
+        filtered_data = self.data_manager.apply_filters(filters)
+        
+        with self._filter_cache_lock:
+            # If a load was installed meanwhile, this may be the old data; don't keep it
+            if self.data_manager.generation != generation:
+                return filtered_data
+            self._filter_cache[key] = filtered_data
+            while len(self._filter_cache) > _FILTER_CACHE_SIZE:
+                evicted, _ = self._filter_cache.popitem(last=False)
+                self._filter_summaries.pop(evicted, None)
+        
+        return filtered_data
+    
+    def _get_filtered_summary(self, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Report summary of the filtered data, cached alongside the filtered frame"""
+        generation = self.data_manager.generation
+        key = self._filter_key(filters)
+        
+        with self._filter_cache_lock:
+            summary = self._filter_summaries.get(key)
+            if summary is not None:
+                return summary
+        
+        summary = self.report_engine.get_report_summary(self._get_filtered(filters))
+        
+        with self._filter_cache_lock:
+            # Only kept while its filtered frame is still cached, and never across loads
+            if key in self._filter_cache and self.data_manager.generation == generation:
+                self._filter_summaries[key] = summary
+        
+        return summary
+    
+    def _filter_key(self, filters: Dict[str, Any]) -> tuple:
+        """Hashable signature of a set of filter values"""
+        return tuple(sorted(
+            ((name, tuple(value) if isinstance(value, list) else value) for name, value in filters.items()),
+            key=str
+        ))
+    
+    def _install_data(self, loaded: LoadedData):
+        """Make newly loaded data current, forgetting frames filtered from the old data in the same step"""
+        with self._filter_cache_lock:
+            self.data_manager.install(loaded)
+            self._filter_cache.clear()
+            self._filter_summaries.clear()
+    
+    def _submit_report(self, work: Callable[[int], Any], on_done: Callable[[Any], None],
+                       on_error: Callable[[Exception], None]):
+        """Run report work in the background, superseding any report still in flight"""
+        token = self._supersede_report()
+        self._current_future = self._submit(lambda: work(token), on_done, on_error, token)
+    
+    def _supersede_report(self) -> int:
+        """Invalidate the in-flight report, if any, and return the new report token"""
+        self._report_token += 1
+        if self._current_future is not None:
+            # Never starts if still queued; otherwise its result is discarded
+            self._current_future.cancel()
+            self._current_future = None
+        return self._report_token
+    
+    def _submit(self, work: Callable[[], Any], on_done: Callable[[Any], None],
+                on_error: Callable[[Exception], None], token: Optional[int] = None,
+                on_tick: Optional[Callable[[], None]] = None) -> Future:
+        """Run work on the executor and deliver its outcome on the Tk thread"""
+        future = self._executor.submit(work)
+        self.root.after(_POLL_INTERVAL_MS, self._poll_future, future, on_done, on_error, token, on_tick)
+        return future
+    
+    def _poll_future(self, future: Future, on_done: Callable[[Any], None],
+                     on_error: Callable[[Exception], None], token: Optional[int] = None,
+                     on_tick: Optional[Callable[[], None]] = None):
+        """Wait for background work without blocking the event loop, calling on_tick while it runs"""
+        if not future.done():
+            if on_tick is not None:
+                on_tick()
+            self.root.after(_POLL_INTERVAL_MS, self._poll_future, future, on_done, on_error, token, on_tick)
+            return
+        
+        if token is not None:
+            # A newer report or a data reload has replaced this one
+            if token != self._report_token:
+                return
+            self._current_future = None
+        
+        self.main_window.show_progress(False)
+        error = future.exception()
+        if error is not None:
+            on_error(error)
+            return
+        
+        try:
+            on_done(future.result())
         except Exception as e:
-            self.main_window.show_progress(False)
-            self.main_window.set_status("Error generating report")
-            messagebox.showerror("Report Error", f"Failed to generate report:\n{str(e)}")
+            on_error(e)
     
     def _generate_report(self, report_type: str, data: pd.DataFrame):
         """Generate specific report type"""
-        if report_type == "critical_hotspots":
-            return self.report_engine.generate_critical_hotspots_report(data)
-        elif report_type == "site_scorecard":
-            return self.report_engine.generate_site_scorecard_report(data)
-        elif report_type == "green_list":
-            return self.report_engine.generate_green_list_report(data)
-        elif report_type == "franchise_overview":
-            return self.report_engine.generate_franchise_overview_report(data)
-        elif report_type == "equipment_analysis":
-            return self.report_engine.generate_equipment_analysis_report(data)
-        elif report_type == "incident_details":
-            return self.report_engine.generate_incident_details_report(data)
-        elif report_type == "repeat_offenders":
-            return self.report_engine.generate_repeat_offenders_report(data)
-        elif report_type == "resolution_tracking":
-            return self.report_engine.generate_resolution_tracking_report(data)
-        elif report_type == "workload_trends":
-            return self.report_engine.generate_workload_trends_report(data)
-        else:
+        generator, _ = self._report_dispatch.get(report_type, (None, None))
+        if generator is None:
             # Placeholder for other report types
             return [], []
+        return generator(data)
     
     def _handle_filter_change(self):
-        """Handle filter changes"""
-        if self.data_manager.data is not None:
+        """Handle filter changes, coalescing rapid edits into one update"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(_FILTER_DEBOUNCE_MS, self._do_filter_change)
+    
+    def _do_filter_change(self):
+        """Update the status bar summary for the current filters"""
+        self._filter_after_id = None
+        if self.data_manager.data is not None and self._load_future is None:
             filters = self.main_window.get_current_filters()
-            filtered_data = self.data_manager.apply_filters(filters)
-            summary = self.report_engine.get_report_summary(filtered_data)
+            summary = self._get_filtered_summary(filters)
             
             # Update status with filtered data info
             if summary:
@@ -320,11 +583,7 @@ class AppController:
         """Handle company selection change"""
         if self.data_manager.data is not None and company != "All":
             # Update site options based on selected company
-            company_sites = self.data_manager.data[
-                self.data_manager.data["Company"] == company
-            ]["Site"].unique().tolist()
-            
-            sites = ["All"] + sorted(company_sites)
+            sites = ["All", *self.data_manager.get_company_sites(company)]
             self.main_window.site_combo['values'] = sites
             self.main_window.site_var.set("All")
         else:
@@ -340,11 +599,7 @@ class AppController:
             self.main_window.update_subcategory_options(subcategories)
         else:
             # Reset to all subcategories
-            all_subcategories = []
-            for subcat_list in self.data_manager.category_mapping.values():
-                all_subcategories.extend(subcat_list)
-            unique_subcategories = sorted(list(set(all_subcategories)))
-            self.main_window.update_subcategory_options(unique_subcategories)
+            self.main_window.update_subcategory_options(self.data_manager.all_subcategories)
         
         self._handle_filter_change()
     
@@ -357,32 +612,30 @@ class AppController:
         try:
             summary = self.data_manager.get_data_summary()
             
-            summary_text = (
-                f"Dataset Summary\n"
-                f"{'='*50}\n\n"
-                f"Total Tickets: {summary['total_tickets']:,}\n"
-                f"Critical Tickets: {summary['critical_tickets']:,} "
-                f"({summary['critical_tickets']/summary['total_tickets']*100:.1f}%)\n"
-                f"Resolved Tickets: {summary['resolved_tickets']:,} "
-                f"({summary['resolved_tickets']/summary['total_tickets']*100:.1f}%)\n"
-                f"Open Tickets: {summary['open_tickets']:,}\n\n"
-                f"Unique Sites: {summary['unique_sites']:,}\n"
-                f"Unique Companies: {summary['unique_companies']:,}\n"
-            )
+            summary_lines = [
+                "Dataset Summary",
+                "=" * 50,
+                "",
+                f"Total Tickets: {summary['total_tickets']:,}",
+                f"Critical Tickets: {summary['critical_tickets']:,} ({summary['critical_percentage']:.1f}%)",
+                f"Resolved Tickets: {summary['resolved_tickets']:,} ({summary['resolved_percentage']:.1f}%)",
+                f"Open Tickets: {summary['open_tickets']:,}",
+                "",
+                f"Unique Sites: {summary['unique_sites']:,}",
+                f"Unique Companies: {summary['unique_companies']:,}"
+            ]
             
             if summary.get('avg_resolution_hours'):
-                summary_text += f"\nAverage Resolution Time: {summary['avg_resolution_hours']:.1f} hours\n"
+                summary_lines += ["", f"Average Resolution Time: {summary['avg_resolution_hours']:.1f} hours"]
             
-            if summary.get('date_range'):
-                date_range = summary['date_range']
-                if 'Created' in date_range:
-                    created = date_range['Created']
-                    start_date = created['min'].strftime("%Y-%m-%d")
-                    end_date = created['max'].strftime("%Y-%m-%d")
-                    summary_text += f"\nDate Range: {start_date} to {end_date}\n"
-                    summary_text += f"Time Span: {(created['max'] - created['min']).days} days\n"
+            if summary.get('date_range_text'):
+                summary_lines += [
+                    "",
+                    f"Date Range: {summary['date_range_text']}",
+                    f"Time Span: {summary['time_span_days']} days"
+                ]
             
-            messagebox.showinfo("Data Summary", summary_text)
+            messagebox.showinfo("Data Summary", "\n".join(summary_lines) + "\n")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate data summary:\n{str(e)}")
@@ -399,7 +652,19 @@ class AppController:
             self.main_window.set_status("Ready - No data loaded")
             self.main_window.update_data_info("")
             # Clear results
-            self.main_window.display_results([], [], "No Data")
+            self._display_results([], [], "No Data")
+    
+    def _display_results(self, results: list, columns: list, title: str):
+        """Show report results in the view and keep them for export"""
+        self._last_results = (results, columns) if results else None
+        self.main_window.display_results(results, columns, title)
+    
+    def _results_frame(self, last_results: tuple, row_indices: Optional[list] = None) -> pd.DataFrame:
+        """DataFrame of the given (rows, columns) results, or of the given rows only"""
+        results, columns = last_results
+        if row_indices is not None:
+            results = [results[index] for index in row_indices]
+        return pd.DataFrame.from_records(results, columns=columns)
     
     def _update_filter_options(self):
         """Update filter dropdown options from loaded data"""
@@ -408,11 +673,7 @@ class AppController:
             self.main_window.update_filter_options(options)
             
             # Set default subcategory options
-            all_subcategories = []
-            for subcat_list in self.data_manager.category_mapping.values():
-                all_subcategories.extend(subcat_list)
-            unique_subcategories = sorted(list(set(all_subcategories)))
-            self.main_window.update_subcategory_options(unique_subcategories)
+            self.main_window.update_subcategory_options(self.data_manager.all_subcategories)
     
     def _handle_drill_down(self, site_name: str):
         """Handle site drill-down functionality"""
@@ -424,37 +685,42 @@ class AppController:
             # Get current filters
             filters = self.main_window.get_current_filters()
             
-            # Apply filters to get filtered data
-            filtered_data = self.data_manager.apply_filters(filters)
-            
-            if filtered_data.empty:
-                messagebox.showwarning("No Data", "No data matches the current filters.")
-                return
-            
             self.main_window.set_status(f"Generating drill-down report for {site_name}...")
-            self.main_window.show_progress(True, 50)
-            self.root.update()
-            
-            # Generate site-specific report
-            results, columns = self.report_engine.generate_site_drill_down_report(filtered_data, site_name)
-            
-            self.main_window.show_progress(False)
-            
-            if not results:
-                messagebox.showinfo("No Results", f"No tickets found for {site_name} with current filters.")
-                self.main_window.set_status("Drill-down completed - no results")
-                return
-            
-            # Display results
-            title = f"Site Drill-Down: {site_name}"
-            self.main_window.display_results(results, columns, title)
+            self.main_window.show_progress(True, None)
+            
+            def work(token):
+                filtered_data = self._get_filtered(filters)
+                if filtered_data.empty or token != self._report_token:
+                    return None
+                return self.report_engine.generate_site_drill_down_report(filtered_data, site_name)
+            
+            def done(report):
+                if report is None:
+                    self._show_no_matching_data()
+                    return
+                
+                results, columns = report
+                if not results:
+                    messagebox.showinfo("No Results", f"No tickets found for {site_name} with current filters.")
+                    self.main_window.set_status("Drill-down completed - no results")
+                    return
+                
+                # Display results
+                title = f"Site Drill-Down: {site_name}"
+                self._display_results(results, columns, title)
+                
+                self.main_window.set_status(f"Drill-down completed: {len(results)} tickets for {site_name}")
             
-            self.main_window.set_status(f"Drill-down completed: {len(results)} tickets for {site_name}")
+            self._submit_report(work, done, self._drill_down_failed)
             
         except Exception as e:
-            self.main_window.show_progress(False)
-            self.main_window.set_status("Error generating drill-down")
-            messagebox.showerror("Drill-Down Error", f"Failed to generate drill-down report:\n{str(e)}")
+            self._drill_down_failed(e)
+    
+    def _drill_down_failed(self, error: Exception):
+        """Surface a drill-down failure"""
+        self.main_window.show_progress(False)
+        self.main_window.set_status("Error generating drill-down")
+        messagebox.showerror("Drill-Down Error", f"Failed to generate drill-down report:\n{str(error)}")
     
     def _handle_export_filtered_data(self):
         """Handle exporting filtered raw data"""
@@ -467,69 +733,43 @@ class AppController:
             filters = self.main_window.get_current_filters()
             
             # Apply filters to get filtered data
-            filtered_data = self.data_manager.apply_filters(filters)
+            filtered_data = self._get_filtered(filters)
             
             if filtered_data.empty:
                 messagebox.showwarning("No Data", "No data matches the current filters.")
                 return
             
+            if self._export_future is not None:
+                return  # An export is already being written
+            
             # Get file path for export
-            file_path = filedialog.asksaveasfilename(
-                title="Export Filtered Data",
-                defaultextension=".csv",
-                filetypes=[
-                    ("CSV files", "*.csv"),
-                    ("Excel files", "*.xlsx"),
-                    ("All files", "*.*")
-                ]
-            )
+            file_path = self._ask_export_path("Export Filtered Data")
             
             if not file_path:
                 return
             
-            # Prepare data for export (clean up internal columns)
-            export_data = filtered_data.copy()
-            
-            # Remove internal calculated columns
-            internal_columns = ["Is_Critical", "Is_Resolved", "Resolution_Hours", "Days_Since_Created"]
-            for col in internal_columns:
-                if col in export_data.columns:
-                    export_data = export_data.drop(columns=[col])
-            
-            # Export data
-            if file_path.lower().endswith('.csv'):
-                export_data.to_csv(file_path, index=False)
-            elif file_path.lower().endswith(('.xlsx', '.xls')):
-                export_data.to_excel(file_path, index=False)
-            else:
-                export_data.to_csv(file_path, index=False)  # Default to CSV
-            
-            self.main_window.set_status(f"Filtered data exported to {file_path}")
-            
-            # Show summary of exported data
-            active_filters = []
-            if filters.get("date_from"):
-                active_filters.append(f"Date from: {filters['date_from']}")
-            if filters.get("date_to"):
-                active_filters.append(f"Date to: {filters['date_to']}")
-            if filters.get("priorities"):
-                active_filters.append(f"Priorities: {', '.join(filters['priorities'])}")
-            if filters.get("company"):
-                active_filters.append(f"Company: {filters['company']}")
-            if filters.get("site"):
-                active_filters.append(f"Site: {filters['site']}")
-            
-            filter_summary = "\n".join(active_filters) if active_filters else "No filters applied"
-            
-            messagebox.showinfo("Export Complete", 
-                              f"Filtered data exported successfully!\n\n"
-                              f"Records exported: {len(export_data)}\n"
-                              f"File: {file_path}\n\n"
-                              f"Applied filters:\n{filter_summary}")
+            self._submit_export(
+                lambda: self._write_filtered_data(filtered_data, file_path),
+                lambda records: self._filtered_data_exported(file_path, records),
+                "Failed to export filtered data"
+            )
             
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export filtered data:\n{str(e)}")
     
+    def _write_filtered_data(self, filtered_data: pd.DataFrame, file_path: str) -> int:
+        """Write filtered raw data on the worker thread; returns the record count"""
+        # Prepare data for export (clean up internal columns)
+        export_data = self._without_internal_columns(filtered_data)
+        
+        # Export data
+        self.exporter.export(export_data, file_path)
+        return len(export_data)
+    
+    def _filtered_data_exported(self, file_path: str, records: int):
+        """Report a finished filtered data export"""
+        self._toast(f"Filtered data exported to {file_path} ({records} records)")
+    
     def _handle_export_comprehensive(self):
         """Handle comprehensive Excel export with all reports in separate sheets"""
         try:
@@ -537,11 +777,15 @@ class AppController:
                 messagebox.showwarning("No Data", "Please load data first.")
                 return
             
+            if self._export_future is not None:
+                return  # An export is already being written
+            
             # Get file path for export (Excel only)
             file_path = filedialog.asksaveasfilename(
+                parent=self.root,
                 title="Export Comprehensive Report",
                 defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx")]
+                filetypes=_EXCEL_FILETYPES
             )
             
             if not file_path:
@@ -549,171 +793,143 @@ class AppController:
             
             # Show progress
             self.main_window.set_status("Generating comprehensive report...")
+            self._export_progress = 0
             self.main_window.show_progress(True, 0)
-            self.root.update()
             
             # Get current filters
             filters = self.main_window.get_current_filters()
-            filtered_data = self.data_manager.apply_filters(filters)
             
-            if filtered_data.empty:
-                messagebox.showwarning("No Data", "No data matches the current filters.")
-                self.main_window.show_progress(False)
-                return
+            # Reports and the workbook are built on the worker threads; the Tk thread only paints progress
+            self._export_future = self._submit(
+                lambda: self._write_comprehensive_export(file_path, filters),
+                lambda records: self._comprehensive_export_finished(file_path, filters, records),
+                self._comprehensive_export_failed,
+                on_tick=self._show_export_progress
+            )
             
-            # Create Excel writer
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                
-                # Sheet 1: Summary Overview
-                self.main_window.show_progress(True, 10)
-                self.root.update()
-                summary_data = self._create_summary_sheet(filtered_data)
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Sheet 2: Critical Hotspots
-                self.main_window.show_progress(True, 20)
-                self.root.update()
-                results, columns = self.report_engine.generate_critical_hotspots_report(filtered_data)
-                if results:
-                    hotspots_df = pd.DataFrame(results, columns=columns)
-                    hotspots_df.to_excel(writer, sheet_name='Critical Hotspots', index=False)
-                
-                # Sheet 3: Site Scorecard
-                self.main_window.show_progress(True, 30)
-                self.root.update()
-                results, columns = self.report_engine.generate_site_scorecard_report(filtered_data)
-                if results:
-                    scorecard_df = pd.DataFrame(results, columns=columns)
-                    scorecard_df.to_excel(writer, sheet_name='Site Scorecard', index=False)
-                
-                # Sheet 4: Green List
-                self.main_window.show_progress(True, 40)
-                self.root.update()
-                results, columns = self.report_engine.generate_green_list_report(filtered_data)
-                if results:
-                    green_df = pd.DataFrame(results, columns=columns)
-                    green_df.to_excel(writer, sheet_name='Green List', index=False)
-                
-                # Sheet 5: Franchise Overview
-                self.main_window.show_progress(True, 50)
-                self.root.update()
-                results, columns = self.report_engine.generate_franchise_overview_report(filtered_data)
-                if results:
-                    franchise_df = pd.DataFrame(results, columns=columns)
-                    franchise_df.to_excel(writer, sheet_name='Franchise Overview', index=False)
-                
-                # Sheet 6: Equipment Analysis
-                self.main_window.show_progress(True, 60)
-                self.root.update()
-                results, columns = self.report_engine.generate_equipment_analysis_report(filtered_data)
-                if results:
-                    equipment_df = pd.DataFrame(results, columns=columns)
-                    equipment_df.to_excel(writer, sheet_name='Equipment Analysis', index=False)
-                
-                # Sheet 7: Repeat Offenders
-                self.main_window.show_progress(True, 70)
-                self.root.update()
-                results, columns = self.report_engine.generate_repeat_offenders_report(filtered_data)
-                if results:
-                    repeat_df = pd.DataFrame(results, columns=columns)
-                    repeat_df.to_excel(writer, sheet_name='Repeat Offenders', index=False)
-                
-                # Sheet 8: Resolution Tracking
-                self.main_window.show_progress(True, 80)
-                self.root.update()
-                results, columns = self.report_engine.generate_resolution_tracking_report(filtered_data)
-                if results:
-                    resolution_df = pd.DataFrame(results, columns=columns)
-                    resolution_df.to_excel(writer, sheet_name='Resolution Tracking', index=False)
-                
-                # Sheet 9: Workload Trends
-                self.main_window.show_progress(True, 85)
-                self.root.update()
-                results, columns = self.report_engine.generate_workload_trends_report(filtered_data)
-                if results:
-                    workload_df = pd.DataFrame(results, columns=columns)
-                    workload_df.to_excel(writer, sheet_name='Workload Trends', index=False)
-                
-                # Sheet 10: Individual Tickets (Full Details)
-                self.main_window.show_progress(True, 90)
-                self.root.update()
-                results, columns = self.report_engine.generate_incident_details_report(filtered_data)
+        except Exception as e:
+            self._comprehensive_export_failed(e)
+    
+    def _write_comprehensive_export(self, file_path: str, filters: Dict[str, Any]) -> Optional[int]:
+        """Write every report to its own sheet on the worker thread; returns the record count, or None if nothing matched"""
+        filtered_data = self._get_filtered(filters)
+        
+        if filtered_data.empty:
+            return None
+        
+        # Reports run concurrently on the export report pool; sheets take them in order as they finish.
+        # Their common aggregates are computed once here, belong to this export only and are dropped with it.
+        shared = self.report_engine.shared_context(filtered_data)
+        reports = {
+            report_type: self._export_report_executor.submit(self._export_report, report_type, filtered_data, shared)
+            for _, report_type, _ in _EXPORT_SHEETS
+        }
+        
+        def sheets():
+            # Summary overview first, then one sheet per report that has results
+            self._tick_progress(10)
+            yield "Summary", ["Metric", "Value"], self._create_summary_sheet(filtered_data)
+            
+            for sheet_name, report_type, progress in _EXPORT_SHEETS:
+                self._tick_progress(progress)
+                results, columns = reports[report_type].result()
                 if results:
-                    incidents_df = pd.DataFrame(results, columns=columns)
-                    incidents_df.to_excel(writer, sheet_name='All Tickets', index=False)
-                
-                # Sheet 11: Raw Data (Filtered)
-                self.main_window.show_progress(True, 95)
-                self.root.update()
-                raw_data = filtered_data.copy()
-                # Remove internal calculated columns
-                internal_columns = ["Is_Critical", "Is_Resolved", "Resolution_Hours", "Days_Since_Created"]
-                for col in internal_columns:
-                    if col in raw_data.columns:
-                        raw_data = raw_data.drop(columns=[col])
-                raw_data.to_excel(writer, sheet_name='Raw Data', index=False)
-            
-            self.main_window.show_progress(False)
-            self.main_window.set_status(f"Comprehensive report exported to {file_path}")
-            
-            # Show completion message
-            active_filters = self._get_active_filters_summary(filters)
-            messagebox.showinfo("Export Complete", 
-                              f"Comprehensive report exported successfully!\n\n"
-                              f"File: {file_path}\n"
-                              f"Records analyzed: {len(filtered_data)}\n"
-                              f"Sheets created: 11 (Summary + 10 report types)\n\n"
-                              f"Applied filters:\n{active_filters}")
+                    yield sheet_name, columns, results
             
-        except Exception as e:
-            self.main_window.show_progress(False)
-            self.main_window.set_status("Error exporting comprehensive report")
-            messagebox.showerror("Export Error", f"Failed to export comprehensive report:\n{str(e)}")
+            # Raw data (filtered), last
+            self._tick_progress(95)
+            raw_data = self._without_internal_columns(filtered_data)
+            yield self.exporter.frame_sheet("Raw Data", raw_data)
+        
+        try:
+            self.exporter.write_excel(file_path, sheets())
+        finally:
+            # Don't leave unused reports queued if writing failed
+            for future in reports.values():
+                future.cancel()
+        
+        return len(filtered_data)
+    
+    def _export_report(self, report_type: str, data: pd.DataFrame, shared: Dict[str, Any]):
+        """Generate one report of a comprehensive export, sharing common aggregates where the report supports it"""
+        generator = self._report_dispatch[report_type][0]
+        if report_type in _SHARED_CONTEXT_REPORTS:
+            return generator(data, shared=shared)
+        return generator(data)
+    
+    def _comprehensive_export_finished(self, file_path: str, filters: Dict[str, Any], records: Optional[int]):
+        """Show the outcome of a background comprehensive export"""
+        self._export_future = None
+        
+        if records is None:
+            self._show_no_matching_data()
+            return
+        
+        self.main_window.set_status(f"Comprehensive report exported to {file_path}")
+        
+        # Show completion message
+        active_filters = self._get_active_filters_summary(filters)
+        messagebox.showinfo("Export Complete",
+                          f"Comprehensive report exported successfully!\n\n"
+                          f"File: {file_path}\n"
+                          f"Records analyzed: {records}\n"
+                          f"Sheets created: 11 (Summary + 10 report types)\n\n"
+                          f"Applied filters:\n{active_filters}")
+    
+    def _comprehensive_export_failed(self, error: Exception):
+        """Surface a comprehensive export failure"""
+        self._export_future = None
+        self.main_window.show_progress(False)
+        self.main_window.set_status("Error exporting comprehensive report")
+        messagebox.showerror("Export Error", f"Failed to export comprehensive report:\n{str(error)}")
+    
+    def _tick_progress(self, value: float):
+        """Record how far the background export has got; the Tk thread paints it while polling"""
+        self._export_progress = value
+    
+    def _show_export_progress(self):
+        """Paint the latest progress reported by the background export"""
+        self.main_window.show_progress(True, self._export_progress)
+    
+    def _without_internal_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Select the source columns of df, leaving out calculated ones"""
+        return df.loc[:, [col for col in df.columns if col not in _INTERNAL_COLUMNS]]
     
     def _create_summary_sheet(self, df: pd.DataFrame) -> list:
-        """Create summary data for the Excel export"""
+        """Create summary (metric, value) rows for the Excel export"""
         summary = self.report_engine.get_report_summary(df)
+        get = summary.get
+        total = get("total_tickets", 0)
+        resolved = get("resolved_tickets", 0)
         
         summary_data = [
-            ["Metric", "Value"],
-            ["Report Generated", pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S")],
-            ["Total Records", summary.get("total_tickets", 0)],
-            ["Critical Incidents", summary.get("critical_tickets", 0)],
-            ["Critical Percentage", f"{summary.get('critical_percentage', 0)}%"],
-            ["Resolved Tickets", summary.get("resolved_tickets", 0)],
-            ["Resolution Rate", f"{summary.get('resolution_rate', 0)}%"],
-            ["Open Tickets", summary.get("total_tickets", 0) - summary.get("resolved_tickets", 0)],
-            ["Unique Sites", summary.get("unique_sites", 0)],
-            ["Unique Companies", summary.get("unique_companies", 0)],
-            ["Average Resolution Time (hours)", summary.get("avg_mttr_hours", "N/A")]
+            ["Report Generated", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            ["Total Records", total],
+            ["Critical Incidents", get("critical_tickets", 0)],
+            ["Critical Percentage", f"{get('critical_percentage', 0)}%"],
+            ["Resolved Tickets", resolved],
+            ["Resolution Rate", f"{get('resolution_rate', 0)}%"],
+            ["Open Tickets", total - resolved],
+            ["Unique Sites", get("unique_sites", 0)],
+            ["Unique Companies", get("unique_companies", 0)],
+            ["Average Resolution Time (hours)", get("avg_mttr_hours", "N/A")]
         ]
         
-        if summary.get("date_range"):
-            date_range = summary["date_range"]
-            if "start" in date_range and date_range["start"]:
-                summary_data.append(["Date Range Start", date_range["start"].strftime("%Y-%m-%d")])
-            if "end" in date_range and date_range["end"]:
-                summary_data.append(["Date Range End", date_range["end"].strftime("%Y-%m-%d")])
+        date_range = get("date_range") or {}
+        start, end = date_range.get("start"), date_range.get("end")
+        if start:
+            summary_data.append(["Date Range Start", start.strftime("%Y-%m-%d")])
+        if end:
+            summary_data.append(["Date Range End", end.strftime("%Y-%m-%d")])
         
         return summary_data
     
     def _get_active_filters_summary(self, filters: dict) -> str:
         """Get summary of active filters for export confirmation"""
-        active_filters = []
-        if filters.get("date_from"):
-            active_filters.append(f"Date from: {filters['date_from']}")
-        if filters.get("date_to"):
-            active_filters.append(f"Date to: {filters['date_to']}")
-        if filters.get("priorities"):
-            active_filters.append(f"Priorities: {', '.join(filters['priorities'])}")
-        if filters.get("company"):
-            active_filters.append(f"Company: {filters['company']}")
-        if filters.get("site"):
-            active_filters.append(f"Site: {filters['site']}")
-        if filters.get("category"):
-            active_filters.append(f"Category: {filters['category']}")
-        if filters.get("subcategory"):
-            active_filters.append(f"Subcategory: {filters['subcategory']}")
-        
-        return "\n".join(active_filters) if active_filters else "No filters applied"
\ No newline at end of file
+        active_filters = [
+            f"{label}: {', '.join(value) if isinstance(value, list) else value}"
+            for key, label in _FILTER_LABELS
+            if (value := filters.get(key))
+        ]
+        
+        return "\n".join(active_filters) if active_filters else "No filters applied"
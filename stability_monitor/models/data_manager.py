@@ -3,25 +3,120 @@ Data loading, validation, and management
 """
 
 import pandas as pd
+import numpy as np
+import hashlib
+import importlib.util
+import json
 import os
 from typing import Dict, List, Optional, Tuple, Any
 from ..utils.date_parser import DateParser
 from ..utils.validators import DataValidator
 
+_DATE_FORMATS = ("data", "date_formats")
+_REQUIRED_COLUMNS = ("data", "required_columns")
+_CACHE_DIR = ("data", "cache_dir")
+
+# Low-cardinality text columns stored as categoricals for cheap filtering and grouping
+_CATEGORICAL_COLUMNS = ("Company", "Site", "Category", "Subcategory", "Priority")
+
+# Equality filters answered from precomputed row positions: (filter key, column)
+_INDEXED_FILTERS = (
+    ("company", "Company"),
+    ("site", "Site"),
+    ("category", "Category"),
+    ("subcategory", "Subcategory")
+)
+_NO_ROWS = np.array([], dtype=np.int64)
+
+# Feather caching of processed data needs pyarrow, which is optional
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Bump whenever preprocessing changes, so data processed by older code is never reused
+_CACHE_VERSION = 1
+
+# Load results that describe the raw file, kept next to its cached data
+_CACHED_INFO = ("total_records", "columns")
+
+class LoadedData:
+    """A processed data set together with the lookups built from it"""
+    
+    def __init__(self, data: Optional[pd.DataFrame] = None, original_data: Optional[pd.DataFrame] = None):
+        self.data = data
+        self.original_data = original_data
+        # Set when installed; tells results computed from different loads apart
+        self.generation = 0
+        self.category_mapping = {}
+        self.all_subcategories = []
+        self.company_sites = {}
+        self.row_index = {}
+        self.summary = None
+        self.metadata = {}
+    
+    def get_rows(self, col: str, value: Any) -> np.ndarray:
+        """Row positions where col equals value"""
+        return self.row_index.get(col, {}).get(value, _NO_ROWS)
+
 class DataManager:
     """Manages data loading, validation, and preprocessing"""
     
     def __init__(self, settings):
         self.settings = settings
-        self.data = None
-        self.original_data = None
-        self.date_parser = DateParser(settings.get("data.date_formats"))
-        self.validator = DataValidator(settings.get("data.required_columns"))
-        self.category_mapping = {}
-        self.metadata = {}
+        self.date_parser = DateParser(settings.get_path(_DATE_FORMATS))
+        self.validator = DataValidator(settings.get_path(_REQUIRED_COLUMNS))
+        self.cache_dir = settings.get_path(_CACHE_DIR)
+        # Loads build a complete LoadedData and install() swaps it in with one assignment,
+        # so readers on other threads never combine one load's frame with another's lookups
+        self._loaded = LoadedData()
+    
+    @property
+    def data(self) -> Optional[pd.DataFrame]:
+        """Processed data of the current load, or None"""
+        return self._loaded.data
+    
+    @property
+    def original_data(self) -> Optional[pd.DataFrame]:
+        """Current data as read from the file, before processing"""
+        return self._loaded.original_data
+    
+    @property
+    def generation(self) -> int:
+        """Number of loads installed so far"""
+        return self._loaded.generation
+    
+    @property
+    def category_mapping(self) -> Dict[str, List[str]]:
+        """Subcategories per category in the current data"""
+        return self._loaded.category_mapping
+    
+    @property
+    def all_subcategories(self) -> List[str]:
+        """Every subcategory in the current data"""
+        return self._loaded.all_subcategories
+    
+    @property
+    def company_sites(self) -> Dict[str, List[str]]:
+        """Sites per company in the current data"""
+        return self._loaded.company_sites
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata of the current load"""
+        return self._loaded.metadata
     
     def load_file(self, file_path: str, column_mapping: Dict[str, str] = None) -> Dict[str, Any]:
-        """Load data from CSV or Excel file"""
+        """Load data from CSV or Excel file and make it current"""
+        validation_results, loaded = self.read_file(file_path, column_mapping)
+        if loaded is not None:
+            self.install(loaded)
+        return validation_results
+    
+    def install(self, loaded: LoadedData):
+        """Make a data set built by read_file or read_cache the current one"""
+        loaded.generation = self._loaded.generation + 1
+        self._loaded = loaded
+    
+    def read_file(self, file_path: str, column_mapping: Dict[str, str] = None) -> Tuple[Dict[str, Any], Optional[LoadedData]]:
+        """Read and process a CSV or Excel file without touching the current data; safe off the Tk thread"""
         try:
             # Determine file type and load
             if file_path.lower().endswith('.csv'):
@@ -36,34 +131,18 @@ class DataManager:
                 df = df.rename(columns=column_mapping)
             
             # Store original data
-            self.original_data = df.copy()
+            original_data = df.copy()
             
             # Validate data
             validation_results = self.validator.validate_dataframe(df)
             
             if not validation_results["valid"]:
-                return validation_results
+                return validation_results, None
             
             # Process and clean data
             df = self._preprocess_data(df)
             
-            # Build category-subcategory mapping
-            self._build_category_mapping(df)
-            
-            # Store processed data
-            self.data = df
-            
-            # Update metadata
-            self._update_metadata(df, file_path)
-            
-            # Add success info to validation results
-            validation_results["info"]["processed_records"] = len(df)
-            validation_results["info"]["date_range"] = self._get_date_range(df)
-            validation_results["info"]["categories"] = len(self.category_mapping)
-            validation_results["info"]["sites"] = df["Site"].nunique()
-            validation_results["info"]["companies"] = df["Company"].nunique()
-            
-            return validation_results
+            return validation_results, self._build_loaded(df, original_data, file_path, validation_results)
             
         except Exception as e:
             return {
@@ -72,7 +151,114 @@ class DataManager:
                 "warnings": [],
                 "info": {},
                 "data_quality": {}
-            }
+            }, None
+    
+    def read_cache(self, file_path: str) -> Optional[Tuple[Dict[str, Any], LoadedData]]:
+        """Read previously processed data for an unchanged file, or None on a cache miss; like read_file, nothing is installed"""
+        cache_path = self._get_cache_path(file_path)
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        
+        try:
+            df = pd.read_feather(cache_path)
+            with open(self._get_results_path(cache_path), "r", encoding="utf-8") as f:
+                cached_results = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read data cache: {e}")
+            return None
+        
+        # Age depends on the current time, so it is never taken from the cache
+        if "Created" in df.columns:
+            df["Days_Since_Created"] = (pd.Timestamp.now() - df["Created"]).dt.days
+        
+        validation_results = {
+            "valid": True,
+            "errors": [],
+            "warnings": cached_results["warnings"],
+            "info": {**cached_results["info"], "from_cache": True},
+            "data_quality": cached_results["data_quality"]
+        }
+        return validation_results, self._build_loaded(df, None, file_path, validation_results)
+    
+    def save_to_cache(self, file_path: str, loaded: LoadedData, validation_results: Dict[str, Any]):
+        """Store processed data and its validation results so the next load of the same file skips parsing"""
+        cache_path = self._get_cache_path(file_path)
+        if cache_path is None:
+            return
+        
+        cached_results = {
+            "warnings": validation_results["warnings"],
+            "info": {key: validation_results["info"][key] for key in _CACHED_INFO},
+            "data_quality": validation_results["data_quality"]
+        }
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._prune_cache(cache_path)
+            loaded.data.reset_index(drop=True).to_feather(cache_path, compression="zstd")
+            with open(self._get_results_path(cache_path), "w", encoding="utf-8") as f:
+                json.dump(cached_results, f)
+        except Exception as e:
+            print(f"Warning: Could not write data cache: {e}")
+    
+    def _get_cache_path(self, file_path: str) -> Optional[str]:
+        """Cache file for the current version of file_path, or None if caching is unavailable"""
+        if not _HAS_PYARROW or not self.cache_dir:
+            return None
+        
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        
+        # Named <source>-<version>, so each source file has at most one entry; the version
+        # covers the file's contents and every setting or code change that affects processing
+        version = json.dumps([
+            _CACHE_VERSION, stat.st_mtime_ns, stat.st_size,
+            list(self.date_parser.date_formats), list(self.validator.required_columns)
+        ])
+        name = f"{self._digest(os.path.abspath(file_path))}-{self._digest(version)}"
+        return os.path.join(self.cache_dir, f"{name}.feather")
+    
+    def _get_results_path(self, cache_path: str) -> str:
+        """Validation results stored alongside a cached data file"""
+        return os.path.splitext(cache_path)[0] + ".json"
+    
+    def _prune_cache(self, cache_path: str):
+        """Remove older entries for the same source file as cache_path"""
+        name = os.path.splitext(os.path.basename(cache_path))[0]
+        source_prefix = name.split("-")[0] + "-"
+        for entry in os.listdir(self.cache_dir):
+            if entry.startswith(source_prefix) and os.path.splitext(entry)[0] != name:
+                os.remove(os.path.join(self.cache_dir, entry))
+    
+    def _digest(self, text: str) -> str:
+        """Short stable hash of text for cache file names"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _build_loaded(self, df: pd.DataFrame, original_data: Optional[pd.DataFrame], file_path: str,
+                      validation_results: Dict[str, Any]) -> LoadedData:
+        """Build the lookups for processed data and fill in the load summary"""
+        loaded = LoadedData(self._downcast_integers(df), original_data)
+        df = loaded.data
+        
+        # Build category-subcategory and company-site lookups for the filter dropdowns
+        loaded.category_mapping = self._build_category_mapping(df)
+        loaded.all_subcategories = sorted({
+            subcategory for subcategories in loaded.category_mapping.values() for subcategory in subcategories
+        })
+        loaded.company_sites = self._build_company_sites(df)
+        loaded.row_index = self._build_row_index(df)
+        loaded.metadata = self._build_metadata(df, file_path)
+        
+        # Add success info to validation results
+        validation_results["info"]["processed_records"] = len(df)
+        validation_results["info"]["date_range"] = self._get_date_range(df)
+        validation_results["info"]["categories"] = len(loaded.category_mapping)
+        validation_results["info"]["sites"] = df["Site"].nunique()
+        validation_results["info"]["companies"] = df["Company"].nunique()
+        
+        return loaded
     
     def _preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and preprocess the data"""
@@ -110,27 +296,60 @@ class DataManager:
             pd.Timestamp.now() - df["Created"]
         ).dt.days
         
+        for col in _CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+        
         return df
     
-    def _build_category_mapping(self, df: pd.DataFrame):
+    def _downcast_integers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store integer columns in the smallest integer type that holds them"""
+        for col in df.select_dtypes(include="integer").columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+        return df
+    
+    def _build_category_mapping(self, df: pd.DataFrame) -> Dict[str, List[str]]:
         """Build dynamic category-subcategory mapping from actual data"""
-        self.category_mapping = {}
+        if "Category" not in df.columns or "Subcategory" not in df.columns:
+            return {}
         
-        if "Category" in df.columns and "Subcategory" in df.columns:
-            # Group by category and collect unique subcategories
-            grouped = df.groupby("Category")["Subcategory"].apply(
-                lambda x: sorted(x.dropna().unique())
-            ).to_dict()
-            
-            # Clean up empty categories
-            self.category_mapping = {
-                k: v for k, v in grouped.items() 
-                if k and str(k).strip() and str(k) != 'nan'
-            }
-    
-    def _update_metadata(self, df: pd.DataFrame, file_path: str):
-        """Update dataset metadata"""
-        self.metadata = {
+        # Group by category and collect unique subcategories
+        grouped = df.groupby("Category", observed=True)["Subcategory"].apply(
+            lambda x: sorted(x.dropna().unique())
+        ).to_dict()
+        
+        # Clean up empty categories
+        return {
+            k: v for k, v in grouped.items() 
+            if k and str(k).strip() and str(k) != 'nan'
+        }
+    
+    def _build_company_sites(self, df: pd.DataFrame) -> Dict[str, List[str]]:
+        """Build company-site mapping so site options don't require scanning the data"""
+        if "Company" not in df.columns or "Site" not in df.columns:
+            return {}
+        
+        return {
+            company: sorted(sites.tolist())
+            for company, sites in df.groupby("Company", observed=True, sort=False)["Site"].unique().items()
+        }
+    
+    def _build_row_index(self, df: pd.DataFrame) -> Dict[str, Dict[Any, np.ndarray]]:
+        """Build sorted row positions per value of each filterable column"""
+        row_index = {}
+        
+        for col in ("Priority",) + tuple(col for _, col in _INDEXED_FILTERS):
+            if col in df.columns:
+                row_index[col] = {
+                    value: positions.astype(np.int64, copy=False)
+                    for value, positions in df.groupby(col, observed=True).indices.items()
+                }
+        
+        return row_index
+    
+    def _build_metadata(self, df: pd.DataFrame, file_path: str) -> Dict[str, Any]:
+        """Build dataset metadata"""
+        return {
             "file_path": file_path,
             "file_name": os.path.basename(file_path),
             "load_timestamp": pd.Timestamp.now(),
@@ -157,25 +376,27 @@ class DataManager:
     
     def get_filter_options(self) -> Dict[str, List[str]]:
         """Get available filter options from current data"""
-        if self.data is None:
+        loaded = self._loaded
+        df = loaded.data
+        if df is None:
             return {}
         
         options = {}
         
         # Priority options
-        if "Priority" in self.data.columns:
-            options["Priority"] = sorted(self.data["Priority"].dropna().unique())
+        if "Priority" in df.columns:
+            options["Priority"] = sorted(df["Priority"].dropna().unique())
         
         # Company options
-        if "Company" in self.data.columns:
-            options["Company"] = sorted(self.data["Company"].dropna().unique())
+        if "Company" in df.columns:
+            options["Company"] = sorted(df["Company"].dropna().unique())
         
         # Site options
-        if "Site" in self.data.columns:
-            options["Site"] = sorted(self.data["Site"].dropna().unique())
+        if "Site" in df.columns:
+            options["Site"] = sorted(df["Site"].dropna().unique())
         
         # Category options
-        options["Category"] = list(self.category_mapping.keys())
+        options["Category"] = list(loaded.category_mapping.keys())
         
         return options
     
@@ -183,39 +404,45 @@ class DataManager:
         """Get subcategories for a specific category"""
         return self.category_mapping.get(category, [])
     
+    def get_company_sites(self, company: str) -> List[str]:
+        """Get sites belonging to a specific company"""
+        return self.company_sites.get(company, [])
+    
     def apply_filters(self, filters: Dict[str, Any]) -> pd.DataFrame:
         """Apply filters to the data and return filtered dataframe"""
-        if self.data is None:
+        # Read the current data set once; a load finishing meanwhile doesn't affect this call
+        loaded = self._loaded
+        if loaded.data is None:
             return pd.DataFrame()
         
-        df = self.data.copy()
+        df = loaded.data
         
-        # Date range filter
-        if filters.get("date_from") and "Created" in df.columns:
-            df = df[df["Created"] >= pd.to_datetime(filters["date_from"])]
-        
-        if filters.get("date_to") and "Created" in df.columns:
-            df = df[df["Created"] <= pd.to_datetime(filters["date_to"])]
+        # Intersect precomputed row positions for the equality filters; positions
+        # stay sorted, so the original row order is preserved
+        positions = None
         
         # Priority filter
         if filters.get("priorities"):
-            df = df[df["Priority"].isin(filters["priorities"])]
+            positions = np.unique(np.concatenate(
+                [loaded.get_rows("Priority", priority) for priority in filters["priorities"]]
+            ))
         
-        # Company filter
-        if filters.get("company") and filters["company"] != "All":
-            df = df[df["Company"] == filters["company"]]
+        # Company, site, category and subcategory filters
+        for key, col in _INDEXED_FILTERS:
+            value = filters.get(key)
+            if value and value != "All":
+                rows = loaded.get_rows(col, value)
+                positions = rows if positions is None else np.intersect1d(positions, rows, assume_unique=True)
         
-        # Site filter
-        if filters.get("site") and filters["site"] != "All":
-            df = df[df["Site"] == filters["site"]]
+        if positions is not None:
+            df = df.iloc[positions]
         
-        # Category filter
-        if filters.get("category") and filters["category"] != "All":
-            df = df[df["Category"] == filters["category"]]
+        # Date range filter
+        if filters.get("date_from") and "Created" in df.columns:
+            df = df[df["Created"] >= pd.to_datetime(filters["date_from"])]
         
-        # Subcategory filter
-        if filters.get("subcategory") and filters["subcategory"] != "All":
-            df = df[df["Subcategory"] == filters["subcategory"]]
+        if filters.get("date_to") and "Created" in df.columns:
+            df = df[df["Created"] <= pd.to_datetime(filters["date_to"])]
         
         # Resolution status filter
         if filters.get("resolution_status"):
@@ -224,24 +451,42 @@ class DataManager:
             elif filters["resolution_status"] == "Resolved":
                 df = df[df["Is_Resolved"] == True]
         
-        return df
+        # Never hand out the loaded frame itself; callers may add or change columns
+        return df.copy(deep=False) if df is loaded.data else df
     
     def get_data_summary(self) -> Dict[str, Any]:
         """Get summary statistics of current dataset"""
-        if self.data is None:
+        loaded = self._loaded
+        if loaded.data is None:
             return {}
         
-        df = self.data
+        # The summary only depends on the loaded data, so compute it once per load
+        if loaded.summary is not None:
+            return loaded.summary
+        
+        df = loaded.data
+        total_tickets = len(df)
+        critical_tickets = df["Is_Critical"].sum()
+        resolved_tickets = df["Is_Resolved"].sum()
         
         summary = {
-            "total_tickets": len(df),
-            "critical_tickets": df["Is_Critical"].sum(),
-            "resolved_tickets": df["Is_Resolved"].sum(),
-            "open_tickets": (~df["Is_Resolved"]).sum(),
+            "total_tickets": total_tickets,
+            "critical_tickets": critical_tickets,
+            "critical_percentage": critical_tickets / total_tickets * 100 if total_tickets else 0.0,
+            "resolved_tickets": resolved_tickets,
+            "resolved_percentage": resolved_tickets / total_tickets * 100 if total_tickets else 0.0,
+            "open_tickets": total_tickets - resolved_tickets,
             "unique_sites": df["Site"].nunique(),
             "unique_companies": df["Company"].nunique(),
             "date_range": self._get_date_range(df),
             "avg_resolution_hours": df["Resolution_Hours"].dropna().mean() if "Resolution_Hours" in df.columns else None
         }
         
-        return summary
\ No newline at end of file
+        # Display-ready created date range
+        created = summary["date_range"].get("Created")
+        if created:
+            summary["date_range_text"] = f"{created['min']:%Y-%m-%d} to {created['max']:%Y-%m-%d}"
+            summary["time_span_days"] = (created["max"] - created["min"]).days
+        
+        loaded.summary = summary
+        return summary
@@ -2,17 +2,42 @@
 Report generation engine
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime, timedelta
 
+_CRITICAL_THRESHOLD = ("reports", "critical_threshold")
+_MTTR_TARGETS = ("reports", "mttr_targets")
+
+# Per-site aggregates used by both the site scorecard and the green list
+_SITE_TOTALS = {
+    "Total_Tickets": ("Number", "count"),
+    "Critical_Count": ("Is_Critical", "sum"),
+    "Avg_MTTR_Hours": ("Resolution_Hours", "mean"),
+    "Resolved_Count": ("Resolution_Hours", "count"),
+    "Total_Resolved": ("Is_Resolved", "sum"),
+    "Longest_Open_Days": ("Days_Since_Created", "max"),
+    "Last_Issue_Date": ("Created", "max")
+}
+
 class ReportEngine:
     """Generates various stability reports from ticket data"""
     
     def __init__(self, settings):
         self.settings = settings
-        self.critical_threshold = settings.get("reports.critical_threshold", 2)
-        self.mttr_targets = settings.get("reports.mttr_targets", {})
+        self.critical_threshold = settings.get_path(_CRITICAL_THRESHOLD, 2)
+        self.mttr_targets = settings.get_path(_MTTR_TARGETS, {})
+    
+    def shared_context(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Aggregates of df that several reports use, built once up front so reports running in parallel only read them"""
+        return {"site_totals": self._site_totals(df, None)}
+    
+    def _site_totals(self, df: pd.DataFrame, shared: Optional[Dict[str, Any]]) -> pd.DataFrame:
+        """Per-site aggregates of df, taken from the shared context built by shared_context when given"""
+        if shared is not None:
+            return shared["site_totals"]
+        return df.groupby(["Site", "Company"], observed=True).agg(**_SITE_TOTALS).reset_index()
     
     def generate_critical_hotspots_report(self, df: pd.DataFrame) -> Tuple[List[List], List[str]]:
         """
@@ -29,7 +54,7 @@ class ReportEngine:
             return [], ["Site", "Company", "Critical Count", "Latest Incident", "Days Since Last", "All Critical Tickets"]
         
         # Group by site and company
-        grouped = critical_df.groupby(["Site", "Company"]).agg({
+        grouped = critical_df.groupby(["Site", "Company"], observed=True).agg({
             "Created": ["count", "max"],
             "Number": "first"  # Just to get a ticket number reference
         }).reset_index()
@@ -51,30 +76,30 @@ class ReportEngine:
         hotspots = hotspots.sort_values(["Critical_Count", "Latest_Incident"], 
                                        ascending=[False, False])
         
+        # Collect ALL critical tickets per site in one grouped pass
+        site_tickets = critical_df["Number"].dropna().groupby(critical_df["Site"], observed=True).agg(
+            lambda numbers: ", ".join([str(t) for t in numbers])
+        ).to_dict()
+        
         # Format for display with ALL critical tickets
         results = []
-        for _, row in hotspots.iterrows():
-            site_name = row["Site"]
-            
-            # Get ALL critical tickets for this site
-            site_critical_tickets = critical_df[critical_df["Site"] == site_name]["Number"].dropna().tolist()
-            all_tickets = ", ".join([str(t) for t in site_critical_tickets])
-            if not all_tickets:
-                all_tickets = "No ticket #s"
+        for row in hotspots.itertuples(index=False):
+            all_tickets = site_tickets.get(row.Site) or "No ticket #s"
             
             results.append([
-                row["Site"],
-                row["Company"],
-                int(row["Critical_Count"]),
-                row["Latest_Incident"].strftime("%Y-%m-%d %H:%M") if pd.notna(row["Latest_Incident"]) else "N/A",
-                int(row["Days_Since_Last"]) if pd.notna(row["Days_Since_Last"]) else "N/A",
+                row.Site,
+                row.Company,
+                int(row.Critical_Count),
+                row.Latest_Incident.strftime("%Y-%m-%d %H:%M") if pd.notna(row.Latest_Incident) else "N/A",
+                int(row.Days_Since_Last) if pd.notna(row.Days_Since_Last) else "N/A",
                 all_tickets
             ])
         
         columns = ["Site", "Company", "Critical Count", "Latest Incident", "Days Since Last", "All Critical Tickets"]
         return results, columns
     
-    def generate_site_scorecard_report(self, df: pd.DataFrame) -> Tuple[List[List], List[str]]:
+    def generate_site_scorecard_report(self, df: pd.DataFrame,
+                                       shared: Optional[Dict[str, Any]] = None) -> Tuple[List[List], List[str]]:
         """
         Generate Site Stability Scorecard
         Shows performance metrics for all sites
@@ -82,18 +107,8 @@ class ReportEngine:
         if df.empty:
             return [], []
         
-        # Group by site and company
-        grouped = df.groupby(["Site", "Company"]).agg({
-            "Number": "count",  # Total tickets
-            "Is_Critical": "sum",  # Critical count
-            "Resolution_Hours": ["mean", "count"],  # MTTR and resolved count
-            "Is_Resolved": "sum",  # Total resolved
-            "Days_Since_Created": "max"  # Longest open issue
-        }).reset_index()
-        
-        # Flatten column names
-        grouped.columns = ["Site", "Company", "Total_Tickets", "Critical_Count", 
-                          "Avg_MTTR_Hours", "Resolved_Count", "Total_Resolved", "Longest_Open_Days"]
+        # Group by site and company; metrics below go on a copy so shared totals stay untouched
+        grouped = self._site_totals(df, shared).copy(deep=False)
         
         # Calculate metrics
         grouped["Critical_Percentage"] = (grouped["Critical_Count"] / grouped["Total_Tickets"] * 100).round(1)
@@ -106,9 +121,9 @@ class ReportEngine:
         
         # Format for display
         results = []
-        for _, row in grouped.iterrows():
+        for row in grouped.itertuples(index=False):
             # Determine status color/indicator
-            mttr_hours = row["Avg_MTTR_Hours"]
+            mttr_hours = row.Avg_MTTR_Hours
             if mttr_hours > 48:
                 status = "🔴 High Risk"
             elif mttr_hours > 24:
@@ -117,13 +132,13 @@ class ReportEngine:
                 status = "🟢 Good"
             
             results.append([
-                row["Site"],
-                row["Company"],
-                int(row["Total_Tickets"]),
-                int(row["Critical_Count"]),
-                f"{row['Critical_Percentage']:.1f}%",
-                f"{row['Avg_MTTR_Hours']:.1f}h" if row["Avg_MTTR_Hours"] > 0 else "N/A",
-                int(row["Longest_Open_Days"]) if row["Longest_Open_Days"] > 0 else "N/A",
+                row.Site,
+                row.Company,
+                int(row.Total_Tickets),
+                int(row.Critical_Count),
+                f"{row.Critical_Percentage:.1f}%",
+                f"{row.Avg_MTTR_Hours:.1f}h" if row.Avg_MTTR_Hours > 0 else "N/A",
+                int(row.Longest_Open_Days) if row.Longest_Open_Days > 0 else "N/A",
                 status
             ])
         
@@ -131,7 +146,8 @@ class ReportEngine:
                   "Avg MTTR", "Longest Open (days)", "Status"]
         return results, columns
     
-    def generate_green_list_report(self, df: pd.DataFrame) -> Tuple[List[List], List[str]]:
+    def generate_green_list_report(self, df: pd.DataFrame,
+                                   shared: Optional[Dict[str, Any]] = None) -> Tuple[List[List], List[str]]:
         """
         Generate Green List - sites with no critical incidents
         """
@@ -139,15 +155,7 @@ class ReportEngine:
             return [], []
         
         # Get all sites
-        all_sites = df.groupby(["Site", "Company"]).agg({
-            "Number": "count",
-            "Is_Critical": "sum",
-            "Created": "max",
-            "Is_Resolved": "sum"
-        }).reset_index()
-        
-        all_sites.columns = ["Site", "Company", "Total_Tickets", "Critical_Count", 
-                           "Last_Issue_Date", "Resolved_Count"]
+        all_sites = self._site_totals(df, shared)
         
         # Filter sites with zero critical incidents
         green_sites = all_sites[all_sites["Critical_Count"] == 0].copy()
@@ -164,13 +172,13 @@ class ReportEngine:
         
         # Format for display
         results = []
-        for _, row in green_sites.iterrows():
+        for row in green_sites.itertuples(index=False):
             results.append([
-                row["Site"],
-                row["Company"],
-                int(row["Total_Tickets"]),
-                row["Last_Issue_Date"].strftime("%Y-%m-%d") if pd.notna(row["Last_Issue_Date"]) else "N/A",
-                int(row["Uptime_Days"]) if pd.notna(row["Uptime_Days"]) else "N/A"
+                row.Site,
+                row.Company,
+                int(row.Total_Tickets),
+                row.Last_Issue_Date.strftime("%Y-%m-%d") if pd.notna(row.Last_Issue_Date) else "N/A",
+                int(row.Uptime_Days) if pd.notna(row.Uptime_Days) else "N/A"
             ])
         
         columns = ["Site", "Company", "Total Non-Critical", "Last Issue", "Uptime Days"]
@@ -185,7 +193,7 @@ class ReportEngine:
             return [], []
         
         # Group by company
-        company_stats = df.groupby("Company").agg({
+        company_stats = df.groupby("Company", observed=True).agg({
             "Site": "nunique",  # Number of sites
             "Number": "count",  # Total tickets
             "Is_Critical": "sum",  # Critical tickets
@@ -206,22 +214,20 @@ class ReportEngine:
         ).round(1)
         
         # Find best and worst performing sites for each company
-        site_performance = df.groupby(["Company", "Site"]).agg({
+        site_performance = df.groupby(["Company", "Site"], observed=True).agg({
             "Is_Critical": "sum",
             "Resolution_Hours": "mean"
         }).reset_index()
         
-        best_worst = []
-        for company in company_stats["Company"]:
-            sites = site_performance[site_performance["Company"] == company]
-            if not sites.empty:
-                # Best site: lowest critical incidents, then lowest MTTR
-                best_site = sites.loc[sites["Is_Critical"].idxmin(), "Site"]
-                # Worst site: highest critical incidents, then highest MTTR
-                worst_site = sites.loc[sites["Is_Critical"].idxmax(), "Site"]
-                best_worst.append((company, best_site, worst_site))
-        
-        best_worst_df = pd.DataFrame(best_worst, columns=["Company", "Best_Site", "Worst_Site"])
+        # Best site: lowest critical incidents; worst site: highest (first site wins ties)
+        critical_by_company = site_performance.groupby("Company", observed=True)["Is_Critical"]
+        best_rows = critical_by_company.idxmin()
+        worst_rows = critical_by_company.idxmax()
+        best_worst_df = pd.DataFrame({
+            "Company": best_rows.index,
+            "Best_Site": site_performance.loc[best_rows.to_numpy(), "Site"].to_numpy(),
+            "Worst_Site": site_performance.loc[worst_rows.to_numpy(), "Site"].to_numpy()
+        })
         
         # Merge with company stats
         company_stats = company_stats.merge(best_worst_df, on="Company", how="left")
@@ -234,16 +240,16 @@ class ReportEngine:
         
         # Format for display
         results = []
-        for _, row in company_stats.iterrows():
+        for row in company_stats.itertuples(index=False):
             results.append([
-                row["Company"],
-                int(row["Sites_Count"]),
-                int(row["Total_Tickets"]),
-                f"{row['Critical_Percentage']:.1f}%",
-                f"{row['Avg_MTTR_Hours']:.1f}h" if row["Avg_MTTR_Hours"] > 0 else "N/A",
-                f"{row['Tickets_Per_Site']:.1f}",
-                row["Best_Site"] if pd.notna(row["Best_Site"]) else "N/A",
-                row["Worst_Site"] if pd.notna(row["Worst_Site"]) else "N/A"
+                row.Company,
+                int(row.Sites_Count),
+                int(row.Total_Tickets),
+                f"{row.Critical_Percentage:.1f}%",
+                f"{row.Avg_MTTR_Hours:.1f}h" if row.Avg_MTTR_Hours > 0 else "N/A",
+                f"{row.Tickets_Per_Site:.1f}",
+                row.Best_Site if pd.notna(row.Best_Site) else "N/A",
+                row.Worst_Site if pd.notna(row.Worst_Site) else "N/A"
             ])
         
         columns = ["Company", "Sites", "Total Tickets", "Critical %", "Avg MTTR", 
@@ -258,11 +264,12 @@ class ReportEngine:
             return [], []
         
         # Group by category and subcategory
-        equipment_stats = df.groupby(["Category", "Subcategory"]).agg({
+        equipment_stats = df.groupby(["Category", "Subcategory"], observed=True).agg({
             "Number": "count",
             "Is_Critical": "sum",
             "Resolution_Hours": "mean",
-            "Site": lambda x: x.value_counts().index[0] if len(x) > 0 else "N/A"  # Most affected site
+            # Most affected site; plain values keep ties in first-seen order for categorical sites
+            "Site": lambda x: x.astype(object).value_counts().index[0] if len(x) > 0 else "N/A"
         }).reset_index()
         
         equipment_stats.columns = ["Category", "Subcategory", "Total_Count", 
@@ -281,16 +288,16 @@ class ReportEngine:
         
         # Format for display
         results = []
-        for _, row in equipment_stats.iterrows():
+        for row in equipment_stats.itertuples(index=False):
             results.append([
-                row["Category"],
-                row["Subcategory"],
-                int(row["Total_Count"]),
-                f"{row['Percentage']:.1f}%",
-                int(row["Critical_Count"]),
-                f"{row['Critical_Rate']:.1f}%",
-                f"{row['Avg_MTTR_Hours']:.1f}h" if row["Avg_MTTR_Hours"] > 0 else "N/A",
-                row["Most_Affected_Site"]
+                row.Category,
+                row.Subcategory,
+                int(row.Total_Count),
+                f"{row.Percentage:.1f}%",
+                int(row.Critical_Count),
+                f"{row.Critical_Rate:.1f}%",
+                f"{row.Avg_MTTR_Hours:.1f}h" if row.Avg_MTTR_Hours > 0 else "N/A",
+                row.Most_Affected_Site
             ])
         
         columns = ["Category", "Subcategory", "Count", "% of Total", "Critical", 
@@ -343,68 +350,73 @@ class ReportEngine:
         # Sort by site, then by created date (most recent first)
         df_sorted = df.sort_values(["Site", "Created"], ascending=[True, False])
         
-        results = []
-        for _, row in df_sorted.iterrows():
-            # Format created date
-            created_str = row["Created"].strftime("%Y-%m-%d %H:%M") if pd.notna(row["Created"]) else "N/A"
-            
-            # Format resolved date and calculate resolution time
-            if pd.notna(row.get("Resolved")):
-                resolved_str = row["Resolved"].strftime("%Y-%m-%d %H:%M")
-                status = "Resolved"
-                resolution_hours = row.get("Resolution_Hours", 0)
-                if resolution_hours and resolution_hours > 0:
-                    if resolution_hours < 24:
-                        resolution_time = f"{resolution_hours:.1f}h"
-                    else:
-                        days = resolution_hours / 24
-                        resolution_time = f"{days:.1f}d"
-                else:
-                    resolution_time = "N/A"
-            else:
-                resolved_str = "Open"
-                status = "Open"
-                # Calculate days since created for open tickets
-                if pd.notna(row["Created"]):
-                    days_open = (pd.Timestamp.now() - row["Created"]).days
-                    resolution_time = f"{days_open}d open"
-                else:
-                    resolution_time = "N/A"
-            
-            # Get ticket description (truncate if too long)
-            description = str(row.get("Short description", "")).strip()
-            if len(description) > 60:
-                description = description[:57] + "..."
-            if not description or description == "nan":
-                description = "No description"
-            
-            # Get category and subcategory
-            category = str(row.get("Category", "")).strip()
-            subcategory = str(row.get("Subcategory", "")).strip()
-            if category == "nan" or not category:
-                category = "Other"
-            if subcategory == "nan" or not subcategory:
-                subcategory = ""
-            
-            category_full = f"{category}" + (f" - {subcategory}" if subcategory else "")
-            
-            results.append([
-                row["Site"],
-                str(row.get("Number", "N/A")),
-                description,
-                category_full,
-                row["Priority"],
-                created_str,
-                resolved_str,
-                resolution_time,
-                status,
-                row["Company"]
-            ])
+        # Optional columns that are absent read as these defaults
+        defaults = {"Number": "N/A", "Short description": "", "Category": "", "Subcategory": "",
+                    "Resolved": None, "Resolution_Hours": 0}
+        df_sorted = df_sorted.assign(**{col: value for col, value in defaults.items() if col not in df_sorted.columns})
+        rows = df_sorted[["Site", "Number", "Short description", "Category", "Subcategory", "Priority",
+                          "Created", "Resolved", "Resolution_Hours", "Company"]]
+        
+        # Format every column in one vectorized pass rather than row by row
+        created = rows["Created"]
+        resolved = pd.to_datetime(rows["Resolved"])  # All-None when the column is absent
+        is_resolved = resolved.notna()
+        created_str = self._format_minutes(created).where(created.notna(), "N/A")
+        resolved_str = self._format_minutes(resolved).where(is_resolved, "Open")
+        status = np.where(is_resolved, "Resolved", "Open")
+        
+        # Open tickets show their age; resolved ones hours under a day, otherwise days
+        days_open = (pd.Timestamp.now() - created).dt.days
+        open_time = (days_open.astype("Int64").astype(str) + "d open").where(created.notna(), "N/A")
+        resolution_time = np.where(is_resolved, "N/A", open_time.to_numpy(dtype=object)).astype(object)
+        hours = pd.to_numeric(rows["Resolution_Hours"], errors="coerce").to_numpy(dtype=float)
+        with np.errstate(invalid="ignore"):
+            timed = np.flatnonzero(is_resolved.to_numpy() & (hours > 0))
+        resolution_time[timed] = [
+            f"{value:.1f}h" if value < 24 else f"{value / 24:.1f}d" for value in hours[timed].tolist()
+        ]
+        
+        # Descriptions are truncated; missing text columns read as "nan" and get placeholders
+        description = self._as_text(rows["Short description"]).str.strip()
+        long_description = description.str.len() > 60
+        description = description.where(~long_description, description.str[:57] + "...")
+        description = description.where(~description.isin(["", "nan"]), "No description")
+        
+        category = self._as_text(rows["Category"]).str.strip()
+        category = category.where(~category.isin(["", "nan"]), "Other")
+        subcategory = self._as_text(rows["Subcategory"]).str.strip()
+        has_subcategory = ~subcategory.isin(["", "nan"])
+        category_full = category.where(~has_subcategory, category + " - " + subcategory)
+        
+        results = [list(row) for row in zip(
+            rows["Site"].tolist(),
+            self._as_text(rows["Number"]).tolist(),
+            description.tolist(),
+            category_full.tolist(),
+            rows["Priority"].tolist(),
+            created_str.tolist(),
+            resolved_str.tolist(),
+            resolution_time.tolist(),
+            status.tolist(),
+            rows["Company"].tolist()
+        )]
         
         columns = ["Site", "Ticket #", "Description", "Category", "Priority", 
                   "Created", "Resolved", "Resolution Time", "Status", "Company"]
         return results, columns
     
+    def _format_minutes(self, values: pd.Series) -> pd.Series:
+        """Format datetimes as YYYY-MM-DD HH:MM; missing values are left unformatted"""
+        if values.dt.tz is not None:
+            return values.dt.strftime("%Y-%m-%d %H:%M")
+        # numpy's C formatter is much faster than strftime for this fixed layout
+        text = np.datetime_as_string(values.to_numpy(dtype="datetime64[m]"), unit="m")
+        return pd.Series(text, index=values.index).str.replace("T", " ", regex=False)
+    
+    def _as_text(self, values: pd.Series) -> pd.Series:
+        """Render values with str(), so missing values read as 'nan' like in a formatted row"""
+        return values.astype(object).map(str)
+    
     def generate_site_drill_down_report(self, df: pd.DataFrame, site_name: str) -> Tuple[List[List], List[str]]:
         """
         Generate drill-down report for a specific site
@@ -465,7 +477,7 @@ class ReportEngine:
             return [], []
         
         # Group by site, company, and category
-        category_groups = df.groupby(["Site", "Company", "Category"]).agg({
+        category_groups = df.groupby(["Site", "Company", "Category"], observed=True).agg({
             "Number": "count",
             "Created": ["min", "max"],
             "Is_Critical": "sum"
@@ -489,15 +501,15 @@ class ReportEngine:
         
         # Format for display
         results = []
-        for _, row in repeat_offenders.iterrows():
+        for row in repeat_offenders.itertuples(index=False):
             results.append([
-                row["Site"],
-                row["Company"], 
-                row["Category"],
-                int(row["Count"]),
-                int(row["Time_Span_Days"]) if row["Time_Span_Days"] >= 0 else 0,
-                int(row["Critical_Count"]),
-                int(row["Pattern_Score"])
+                row.Site,
+                row.Company, 
+                row.Category,
+                int(row.Count),
+                int(row.Time_Span_Days) if row.Time_Span_Days >= 0 else 0,
+                int(row.Critical_Count),
+                int(row.Pattern_Score)
             ])
         
         columns = ["Site", "Company", "Category", "Incident Count", "Time Span (days)", "Critical Count", "Pattern Score"]
@@ -521,9 +533,9 @@ class ReportEngine:
         sla_targets = self.mttr_targets
         
         results = []
-        for _, row in resolved_df.iterrows():
-            priority = row["Priority"]
-            resolution_hours = row["Resolution_Hours"]
+        for row in resolved_df.itertuples(index=False):
+            priority = row.Priority
+            resolution_hours = row.Resolution_Hours
             
             if priority in sla_targets and resolution_hours is not None:
                 target_hours = sla_targets[priority]
@@ -546,8 +558,8 @@ class ReportEngine:
                         target_str = f"{target_hours/24:.1f}d"
                     
                     results.append([
-                        row["Site"],
-                        str(row.get("Number", "N/A")),
+                        row.Site,
+                        str(getattr(row, "Number", "N/A")),
                         priority,
                         resolution_str,
                         target_str,
@@ -600,24 +612,24 @@ class ReportEngine:
         
         # Format for display
         results = []
-        for _, row in weekly_stats.iterrows():
+        for row in weekly_stats.itertuples(index=False):
             # Format week range
-            week_start = row["Week_Start"]
+            week_start = row.Week_Start
             week_end = week_start + pd.Timedelta(days=6)
             week_range = f"{week_start.strftime('%m/%d')} - {week_end.strftime('%m/%d')}"
             
-            backlog_change = int(row["Backlog_Change"])
+            backlog_change = int(row.Backlog_Change)
             backlog_indicator = "📈" if backlog_change > 0 else "📉" if backlog_change < 0 else "➡️"
             
             results.append([
                 week_range,
-                int(row["New_Tickets"]),
-                int(row["Critical_Count"]),
-                f"{row['Critical_Rate']:.1f}%",
-                int(row["Resolved_Count"]),
-                f"{row['Resolution_Rate']:.1f}%",
+                int(row.New_Tickets),
+                int(row.Critical_Count),
+                f"{row.Critical_Rate:.1f}%",
+                int(row.Resolved_Count),
+                f"{row.Resolution_Rate:.1f}%",
                 f"{backlog_indicator} {abs(backlog_change)}",
-                row["Peak_Day"]
+                row.Peak_Day
             ])
         
         columns = ["Week", "New Tickets", "Critical", "Critical %", "Resolved", "Resolution %", "Backlog Change", "Peak Day"]
@@ -2,16 +2,20 @@
 Date parsing utilities for flexible date format handling
 """
 
+import re
 from datetime import datetime
 from dateutil.parser import parse as dateutil_parse
 from typing import Optional, List
 import pandas as pd
 
+# Format directives; formats that differ only in these can match the same text
+_DIRECTIVE = re.compile(r"%[a-zA-Z]")
+
 class DateParser:
     """Handles parsing of various date formats"""
     
     def __init__(self, date_formats: List[str] = None):
-        self.date_formats = date_formats or [
+        self.date_formats = tuple(date_formats or (
             "%m/%d/%Y %H:%M",
             "%Y-%m-%d %H:%M:%S", 
             "%m/%d/%Y",
@@ -21,7 +25,17 @@ class DateParser:
             "%Y-%m-%d %H:%M",
             "%m-%d-%Y %H:%M",
             "%m-%d-%Y"
-        ]
+        ))
+        # Columns are almost always in one format, so try the last match first
+        self._last_format = None
+        
+        # Earlier formats that could also match text in each format, e.g. %m/%d/%Y for %d/%m/%Y;
+        # they take precedence over a last-format match, as in the full scan
+        self._rivals = {
+            fmt: tuple(other for other in self.date_formats[:index]
+                       if _DIRECTIVE.sub("%", other) == _DIRECTIVE.sub("%", fmt))
+            for index, fmt in enumerate(self.date_formats)
+        }
     
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse a date string using multiple format attempts"""
@@ -30,12 +44,30 @@ class DateParser:
             
         date_str = str(date_str).strip()
         
+        last_format = self._last_format
+        if last_format is not None:
+            try:
+                parsed = datetime.strptime(date_str, last_format)
+            except ValueError:
+                parsed = None
+            if parsed is not None:
+                for fmt in self._rivals[last_format]:
+                    try:
+                        return datetime.strptime(date_str, fmt)
+                    except ValueError:
+                        continue
+                return parsed
+        
         # Try predefined formats first (faster)
         for fmt in self.date_formats:
+            if fmt is last_format:
+                continue
             try:
-                return datetime.strptime(date_str, fmt)
+                parsed = datetime.strptime(date_str, fmt)
             except ValueError:
                 continue
+            self._last_format = fmt
+            return parsed
         
         # Fall back to dateutil parser (more flexible but slower)
         try:
@@ -45,7 +77,26 @@ class DateParser:
     
     def parse_series(self, series: pd.Series) -> pd.Series:
         """Parse a pandas Series of date strings"""
-        return series.apply(self.parse_date)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        
+        text = series.where(series.isna(), series.astype(str).str.strip())
+        present = text.notna() & (text != "")
+        
+        # Parse the whole column in one vectorized pass using the dominant format
+        fmt = self.detect_format(text[present].tolist())
+        if fmt is None:
+            return series.apply(self.parse_date)
+        parsed = pd.to_datetime(text, format=fmt, errors="coerce")
+        
+        # Values in any other format, or that an earlier format also fits, go through the per-value parser
+        retry = present & parsed.isna()
+        for rival in self._rivals[fmt]:
+            retry |= pd.to_datetime(text, format=rival, errors="coerce").notna()
+        if retry.any():
+            parsed[retry] = pd.to_datetime(text[retry].apply(self.parse_date))
+        
+        return parsed
     
     def detect_format(self, date_strings: List[str], sample_size: int = 100) -> Optional[str]:
         """Detect the most likely date format from a sample"""
@@ -0,0 +1,189 @@
+"""
+CSV, Excel and columnar export writers
+"""
+
+import csv
+import importlib.util
+import io
+import os
+import pandas as pd
+from typing import Iterable, Sequence, Tuple
+
+# A worksheet as (sheet name, column headers, rows)
+Sheet = Tuple[str, Sequence, Iterable[Sequence]]
+
+# Optional native writers; pandas' own writers are used when they're missing
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# Arrow quotes every string (and the header) unless told not to quote at all, so rows are
+# written unquoted, ending lines as to_csv does, and values that need quotes are left to pandas
+_CSV_WRITE_OPTIONS = None
+if pa is not None:
+    try:
+        _CSV_WRITE_OPTIONS = pa_csv.WriteOptions(include_header=False, quoting_style="none", eol=os.linesep)
+    except TypeError:
+        pass  # Older pyarrow without these options; pandas writes every CSV
+
+# The Excel writers are slow to import, so they are only loaded on the first Excel export
+_HAS_XLSXWRITER = importlib.util.find_spec("xlsxwriter") is not None
+
+# Matches the header style pandas applies in to_excel
+_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+_DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+
+# Rows converted to Python values at a time while streaming a frame to Excel
+_EXCEL_CHUNK_ROWS = 10000
+
+# CSV files are written through a large buffer so rows reach the disk in few, big writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+class DataExporter:
+    """Writes DataFrames to CSV or Excel files"""
+    
+    def export(self, df: pd.DataFrame, file_path: str, sheet_name: str = "Sheet1"):
+        """Write a frame to CSV, Excel, Parquet or Feather depending on the file extension"""
+        extension = file_path.lower()
+        if extension.endswith(('.xlsx', '.xls')):
+            self.write_excel(file_path, [self.frame_sheet(sheet_name, df)])
+        elif extension.endswith('.parquet'):
+            self._columnar_frame(df).to_parquet(file_path, compression="zstd", index=False)
+        elif extension.endswith('.feather'):
+            # Feather only stores a default index
+            self._columnar_frame(df).reset_index(drop=True).to_feather(file_path, compression="lz4")
+        else:
+            self.write_csv(df, file_path)  # Default to CSV
+    
+    def write_csv(self, df: pd.DataFrame, file_path: str):
+        """Write a frame to CSV exactly as to_csv would, using the Arrow C++ writer when possible"""
+        table = self._to_arrow(df) if _CSV_WRITE_OPTIONS is not None else None
+        
+        if table is not None:
+            try:
+                with pa.output_stream(file_path, buffer_size=_WRITE_BUFFER_SIZE) as stream:
+                    stream.write(self._csv_header(df))
+                    pa_csv.write_csv(table, stream, _CSV_WRITE_OPTIONS)
+                return
+            except pa.ArrowInvalid:
+                pass  # A value contains a delimiter, quote or line break and must be quoted
+        
+        with open(file_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as stream:
+            df.to_csv(stream, index=False)
+    
+    def _csv_header(self, df: pd.DataFrame) -> bytes:
+        """Header line quoted the way to_csv quotes it"""
+        header = io.StringIO()
+        csv.writer(header, lineterminator=os.linesep).writerow(df.columns)
+        return header.getvalue().encode("utf-8")
+    
+    def frame_sheet(self, sheet_name: str, df: pd.DataFrame) -> Sheet:
+        """Describe a frame as a worksheet; missing values become blank cells"""
+        return sheet_name, list(df.columns), self._frame_rows(df)
+    
+    def _frame_rows(self, df: pd.DataFrame) -> Iterable[tuple]:
+        """Yield the rows of df as tuples, converting one chunk at a time so only that chunk is held as objects"""
+        for start in range(0, len(df), _EXCEL_CHUNK_ROWS):
+            chunk = df.iloc[start:start + _EXCEL_CHUNK_ROWS]
+            values = chunk.astype(object).where(chunk.notna(), None)
+            yield from values.itertuples(index=False, name=None)
+    
+    def write_excel(self, file_path: str, sheets: Iterable[Sheet]):
+        """Write each (name, columns, rows) sheet to an Excel workbook, in order"""
+        if not _HAS_XLSXWRITER:
+            self._write_excel_openpyxl(file_path, sheets)
+            return
+        
+        import xlsxwriter
+        
+        # constant_memory flushes each row once written, so rows must be written in order
+        workbook = xlsxwriter.Workbook(file_path, {
+            "constant_memory": True,
+            "default_date_format": _DATETIME_FORMAT
+        })
+        try:
+            header_format = workbook.add_format(_HEADER_FORMAT)
+            for sheet_name, columns, rows in sheets:
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, columns, header_format)
+                for row_index, row in enumerate(rows, start=1):
+                    worksheet.write_row(row_index, 0, row)
+        finally:
+            workbook.close()
+    
+    def _write_excel_openpyxl(self, file_path: str, sheets: Iterable[Sheet]):
+        """Write sheets with openpyxl in write-only mode, streaming rows instead of holding cells"""
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        
+        workbook = openpyxl.Workbook(write_only=True)
+        header_font = Font(bold=True)
+        for sheet_name, columns, rows in sheets:
+            worksheet = workbook.create_sheet(sheet_name)
+            header = []
+            for column in columns:
+                cell = WriteOnlyCell(worksheet, value=column)
+                cell.font = header_font
+                header.append(cell)
+            worksheet.append(header)
+            for row in rows:
+                worksheet.append(row)
+        workbook.save(file_path)
+    
+    def _columnar_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Frame Arrow can store by column; mixed-type columns (e.g. counts with "N/A") are written as text"""
+        mixed = {
+            col: df[col].map(str, na_action="ignore")
+            for col in df.columns
+            if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) in ("mixed", "mixed-integer")
+        }
+        return df.assign(**mixed) if mixed else df
+    
+    def _to_arrow(self, df: pd.DataFrame):
+        """Convert a frame to an Arrow table that prints like to_csv, or None if Arrow would print it differently"""
+        # A lone empty field is quoted by to_csv so the line isn't blank
+        if len(df.columns) < 2:
+            return None
+        
+        text_columns = {}
+        for col in df.columns:
+            dtype = df[col].dtype
+            if pd.api.types.is_float_dtype(dtype) and dtype.itemsize != 8:
+                return None  # to_csv prints narrow floats at their own precision
+            elif pd.api.types.is_float_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+                # Arrow spells these differently (1e-05 as 0.00001, True as true)
+                text_columns[col] = df[col].map(str, na_action="ignore").astype(object)
+            elif isinstance(dtype, pd.CategoricalDtype):
+                if pd.api.types.infer_dtype(dtype.categories) not in ("string", "integer", "empty"):
+                    return None
+            elif pd.api.types.is_object_dtype(dtype):
+                # Mixed-type columns (e.g. counts with "N/A") need pandas' writer
+                if pd.api.types.infer_dtype(df[col], skipna=True) not in ("string", "empty"):
+                    return None
+            elif not (pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+                      or pd.api.types.is_datetime64_dtype(dtype)):
+                return None  # e.g. timezones or timedeltas, which Arrow formats its own way
+        
+        if text_columns:
+            df = df.assign(**text_columns)
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        
+        for index, field in enumerate(table.schema):
+            if pa.types.is_timestamp(field.type):
+                values = df.iloc[:, index].dropna()
+                try:
+                    if (values == values.dt.normalize()).all():
+                        # to_csv writes dates alone when every value falls at midnight
+                        column = table.column(index).cast(pa.date32())
+                    else:
+                        # Whole-second data is written without the trailing .000000
+                        column = table.column(index).cast(pa.timestamp("s"))
+                except pa.ArrowInvalid:
+                    return None  # Fractional seconds, which to_csv trims its own way
+                table = table.set_column(index, field.name, column)
+        
+        return table
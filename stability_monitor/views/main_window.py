@@ -4,7 +4,11 @@ Main application window
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Optional
+
+# Result rows are added to the tree a page at a time as the user scrolls
+_RESULTS_PAGE_SIZE = 500
+_LOAD_MORE_THRESHOLD = 0.9
 
 class MainWindow:
     """Main application window with all UI components"""
@@ -14,6 +18,10 @@ class MainWindow:
         self.settings = settings
         self.callbacks = {}
         
+        # Rows of the current results and how many are already in the tree
+        self._result_rows = []
+        self._rows_shown = 0
+        
         # Configure main window
         self._setup_window()
         self._create_menu()
@@ -37,6 +45,9 @@ class MainWindow:
         # Configure grid weights for resizing
         self.root.grid_rowconfigure(1, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
+        
+        # Closing the window exits the same way as File > Exit
+        self.root.protocol("WM_DELETE_WINDOW", self._on_exit)
     
     def _create_menu(self):
         """Create application menu bar"""
@@ -50,7 +61,7 @@ class MainWindow:
         file_menu.add_separator()
         file_menu.add_command(label="Export Results...", command=self._on_export_results, accelerator="Ctrl+E")
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_exit)
         
         # Reports menu
         reports_menu = tk.Menu(menubar, tearoff=0)
@@ -352,9 +363,10 @@ class MainWindow:
         self.results_tree.grid(row=0, column=0, sticky="nsew")
         
         # Scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.results_tree.yview)
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.results_tree.configure(yscrollcommand=v_scrollbar.set)
+        self.results_v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.results_tree.yview)
+        self.results_v_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.results_tree.configure(yscrollcommand=self._on_results_scroll)
+        self.results_tree.bind('<Control-a>', self._on_select_all_results)
         
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.results_tree.xview)
         h_scrollbar.grid(row=1, column=0, sticky="ew")
@@ -395,6 +407,13 @@ class MainWindow:
         if 'load_data' in self.callbacks:
             self.callbacks['load_data']()
     
+    def _on_exit(self):
+        """Handle File > Exit and closing the window"""
+        if 'exit' in self.callbacks:
+            self.callbacks['exit']()
+        else:
+            self.root.quit()
+    
     def _on_export_results(self):
         """Handle export results button click"""
         if 'export_results' in self.callbacks:
@@ -632,8 +651,7 @@ class MainWindow:
     def display_results(self, data: list, columns: list, title: str = "Results"):
         """Display results in the treeview"""
         # Clear existing data
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
         
         # Configure columns
         self.results_tree['columns'] = columns
@@ -644,25 +662,73 @@ class MainWindow:
             self.results_tree.heading(col, text=col)
             self.results_tree.column(col, width=120, minwidth=80)
         
-        # Insert data
-        for row in data:
-            self.results_tree.insert('', 'end', values=row)
+        # Insert the first page; the rest follows as the user scrolls down
+        self._result_rows = data
+        self._rows_shown = 0
+        self._show_more_results()
         
         # Update results info
         self.results_info_label.config(text=f"{title}: {len(data)} records")
     
+    def _show_more_results(self, count: int = _RESULTS_PAGE_SIZE):
+        """Append the next count result rows (a page by default) to the tree"""
+        start = self._rows_shown
+        end = min(start + count, len(self._result_rows))
+        
+        # Item ids are row positions so selections map back to the results.
+        # Rows go straight to the Tcl command as native lists, skipping ttk's
+        # per-call option formatting and quoting.
+        tree = self.results_tree
+        call, widget, rows = tree.tk.call, tree._w, self._result_rows
+        for index in range(start, end):
+            call(widget, 'insert', '', 'end', '-id', str(index), '-values', rows[index])
+        self._rows_shown = end
+    
+    def _on_results_scroll(self, first: str, last: str):
+        """Update the scrollbar and load more rows when nearing the end"""
+        self.results_v_scrollbar.set(first, last)
+        if self._rows_shown < len(self._result_rows) and float(last) >= _LOAD_MORE_THRESHOLD:
+            self._show_more_results()
+    
+    def _on_select_all_results(self, event=None):
+        """Select every result row, adding the pages not yet shown so none are left out"""
+        self._show_more_results(len(self._result_rows))
+        self.results_tree.selection_set(self.results_tree.get_children())
+        return "break"
+    
+    def get_selected_row_indices(self) -> list:
+        """Get the result row positions of the selected tree items"""
+        return sorted(int(item) for item in self.results_tree.selection())
+    
     def set_status(self, status: str):
         """Update status bar text"""
         self.status_label.config(text=status)
     
-    def show_progress(self, show: bool = True, value: float = 0):
-        """Show/hide progress bar"""
+    def get_status(self) -> str:
+        """Current status bar text"""
+        return self.status_label.cget("text")
+    
+    def show_progress(self, show: bool = True, value: Optional[float] = 0):
+        """Show/hide progress bar; a value of None animates it while work runs in the background"""
         if show:
             self.progress_bar.pack(side=tk.LEFT, padx=(10, 0))
-            self.progress_var.set(value)
+            if value is None:
+                if str(self.progress_bar.cget('mode')) != 'indeterminate':
+                    self.progress_bar.config(mode='indeterminate')
+                    self.progress_bar.start()
+            else:
+                self._stop_progress_animation()
+                self.progress_var.set(value)
         else:
+            self._stop_progress_animation()
             self.progress_bar.pack_forget()
     
+    def _stop_progress_animation(self):
+        """Return the progress bar to determinate mode"""
+        if str(self.progress_bar.cget('mode')) == 'indeterminate':
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate')
+    
     def update_data_info(self, info: str):
         """Update data information in status bar"""
         self.data_info_label.config(text=info)
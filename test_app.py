@@ -5,11 +5,145 @@ Test script for the stability monitor application
 
 import sys
 import os
+import itertools
+import shutil
+import tempfile
+from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import numpy as np
+import pandas as pd
+from dateutil.parser import parse as dateutil_parse
+
 from stability_monitor.models.data_manager import DataManager
 from stability_monitor.models.report_engine import ReportEngine
 from stability_monitor.config.settings import Settings
+from stability_monitor.utils.exporters import DataExporter
+from stability_monitor.utils.date_parser import DateParser
+
+def test_settings():
+    """Test settings lookup and user overrides"""
+    print("Testing settings...")
+    
+    settings = Settings()
+    assert settings.get("ui.window_width") == 1200
+    assert settings.get("ui.missing", "fallback") == "fallback"
+    
+    # Partial overrides of nested sections keep the remaining defaults
+    settings._merge_settings({"reports": {"mttr_targets": {"1 - Critical": 2}}})
+    mttr_targets = settings.get("reports.mttr_targets")
+    assert mttr_targets["1 - Critical"] == 2
+    assert mttr_targets["4 - Low"] == 168
+    assert settings.get("reports.critical_threshold") == 2
+    
+    # Editing a returned section doesn't leak into later lookups
+    mttr_targets["1 - Critical"] = 99
+    assert settings.get("reports.mttr_targets")["1 - Critical"] == 2
+    assert settings.get_path(("reports", "mttr_targets"))["1 - Critical"] == 2
+    
+    # Defaults and user overrides have the same types
+    assert isinstance(settings.get("data.required_columns"), list)
+    settings._merge_settings({"data": {"date_formats": ["%d/%m/%Y"]}})
+    assert settings.get("data.date_formats") == ["%d/%m/%Y"]
+    assert Settings().get("data.date_formats") is not Settings().get("data.date_formats")
+    
+    settings.set("ui.theme", "dark")
+    assert settings.get("ui.theme") == "dark"
+    
+    # Keys containing dots survive merging, lookups and a save/load round trip
+    settings._merge_settings({"reports": {"mttr_targets": {"P1.urgent": 2}}})
+    assert settings.get("reports.mttr_targets")["P1.urgent"] == 2
+    assert "P1" not in settings.get("reports.mttr_targets")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings.config_file = os.path.join(tmp_dir, "app_settings.json")
+        settings.save()
+        reloaded = Settings()
+        reloaded.config_file = settings.config_file
+        reloaded._load_user_settings()
+        assert reloaded.settings == settings.settings
+        assert reloaded.get("reports.mttr_targets")["P1.urgent"] == 2
+    
+    print("✓ Settings tested successfully!")
+
+def _parse_date_one_by_one(date_formats, value):
+    """Reference date parsing: every format in order for each value, then dateutil"""
+    if pd.isna(value) or not str(value).strip():
+        return None
+    value = str(value).strip()
+    for fmt in date_formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    try:
+        return dateutil_parse(value)
+    except (ValueError, TypeError):
+        return None
+
+def test_date_parsing():
+    """Test that whole-column date parsing matches parsing each value on its own"""
+    print("\nTesting date parsing...")
+    
+    parser = DateParser()
+    columns = [
+        # One dominant format, with blanks, missing values and stray formats
+        ["06/15/2025 09:30", "06/16/2025 10:45", " 06/17/2025 08:00 ", "", None, "2025-06-18", "not a date",
+         "June 19, 2025"] + [f"07/{day:02d}/2025 12:00" for day in range(1, 21)],
+        # Mostly ISO timestamps
+        [f"2025-05-{day:02d} 23:59:59" for day in range(1, 29)] + ["05/29/2025", np.nan],
+        # Mostly day-first, where ambiguous values still read month-first as the formats are ordered
+        [f"{day:02d}/02/2025" for day in range(13, 29)] + ["01/02/2025", "05/06/2025 "],
+        # No dominant format
+        ["2025-01-02", "01/03/2025", "03-04-2025 10:00", "garbage", ""]
+    ]
+    for values in columns:
+        series = pd.Series(values, dtype=object)
+        expected = pd.to_datetime(series.apply(lambda value: _parse_date_one_by_one(parser.date_formats, value)))
+        parsed = pd.to_datetime(parser.parse_series(series))
+        pd.testing.assert_series_equal(parsed, expected, check_dtype=False)
+    
+    print("✓ Date parsing tested successfully!")
+
+def test_data_cache():
+    """Test that cached data loads back exactly as it was processed"""
+    print("\nTesting data cache...")
+    
+    cache_dir = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(cache_dir, "tickets.csv")
+        shutil.copy("stability_monitor/tests/sample_data/wowzi.csv", csv_path)
+        settings = Settings()
+        settings.set("data.cache_dir", os.path.join(cache_dir, "cache"))
+        
+        data_manager = DataManager(settings)
+        result, loaded = data_manager.read_file(csv_path)
+        data_manager.save_to_cache(csv_path, loaded, result)
+        
+        cached_manager = DataManager(settings)
+        cached_result, cached = cached_manager.read_cache(csv_path)
+        cached_manager.install(cached)
+        
+        assert cached_result["info"]["from_cache"]
+        assert cached_result["warnings"] == result["warnings"]
+        assert cached_result["data_quality"] == result["data_quality"]
+        assert cached_result["info"]["total_records"] == result["info"]["total_records"]
+        pd.testing.assert_frame_equal(cached.data, loaded.data)
+        assert cached.category_mapping == loaded.category_mapping
+        data_manager.install(loaded)
+        assert cached_manager.get_filter_options() == data_manager.get_filter_options()
+        
+        # Different parsing settings or a changed file never reuse the cached copy
+        other_settings = Settings()
+        other_settings.set("data.cache_dir", settings.get("data.cache_dir"))
+        other_settings.set("data.date_formats", ["%Y-%m-%d"])
+        assert DataManager(other_settings).read_cache(csv_path) is None
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("\n")
+        assert DataManager(settings).read_cache(csv_path) is None
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    
+    print("✓ Data cache tested successfully!")
 
 def test_data_loading():
     """Test data loading functionality"""
@@ -72,6 +206,15 @@ def test_reports(data_manager):
     results, columns = report_engine.generate_green_list_report(data_manager.data)
     print(f"  - Found {len(results)} stable sites")
     
+    # Reports sharing one context must match the standalone ones and leave the shared totals as built
+    shared = report_engine.shared_context(data_manager.data)
+    site_totals = shared["site_totals"].copy()
+    shared_scorecard = report_engine.generate_site_scorecard_report(data_manager.data, shared=shared)
+    shared_green_list = report_engine.generate_green_list_report(data_manager.data, shared=shared)
+    assert shared_green_list == (results, columns), "Green list differs with a shared context"
+    assert shared_scorecard == report_engine.generate_site_scorecard_report(data_manager.data), "Scorecard differs with a shared context"
+    assert shared["site_totals"].equals(site_totals), "Reports modified the shared site totals"
+    
     # Test Franchise Overview report
     print("Testing Franchise Overview report...")
     results, columns = report_engine.generate_franchise_overview_report(data_manager.data)
@@ -105,6 +248,87 @@ def test_reports(data_manager):
     
     print("✓ All reports tested successfully!")
 
+def _incident_details_row_by_row(df):
+    """Reference incident details: each ticket formatted on its own"""
+    results = []
+    for _, row in df.sort_values(["Site", "Created"], ascending=[True, False]).iterrows():
+        created_str = row["Created"].strftime("%Y-%m-%d %H:%M") if pd.notna(row["Created"]) else "N/A"
+        if pd.notna(row.get("Resolved")):
+            resolved_str = row["Resolved"].strftime("%Y-%m-%d %H:%M")
+            status = "Resolved"
+            resolution_hours = row.get("Resolution_Hours", 0)
+            if resolution_hours and resolution_hours > 0:
+                resolution_time = f"{resolution_hours:.1f}h" if resolution_hours < 24 else f"{resolution_hours / 24:.1f}d"
+            else:
+                resolution_time = "N/A"
+        else:
+            resolved_str = "Open"
+            status = "Open"
+            if pd.notna(row["Created"]):
+                resolution_time = f"{(pd.Timestamp.now() - row['Created']).days}d open"
+            else:
+                resolution_time = "N/A"
+        
+        description = str(row.get("Short description", "")).strip()
+        if len(description) > 60:
+            description = description[:57] + "..."
+        if not description or description == "nan":
+            description = "No description"
+        
+        category = str(row.get("Category", "")).strip()
+        subcategory = str(row.get("Subcategory", "")).strip()
+        if category == "nan" or not category:
+            category = "Other"
+        if subcategory == "nan" or not subcategory:
+            subcategory = ""
+        
+        results.append([
+            row["Site"],
+            str(row.get("Number", "N/A")),
+            description,
+            category + (f" - {subcategory}" if subcategory else ""),
+            row["Priority"],
+            created_str,
+            resolved_str,
+            resolution_time,
+            status,
+            row["Company"]
+        ])
+    return results
+
+def test_incident_details(data_manager):
+    """Test that the vectorized incident details match formatting each ticket on its own"""
+    print("\nTesting incident details...")
+    
+    report_engine = ReportEngine(Settings())
+    
+    # Edge cases: missing text, long descriptions, short and zero resolution times, unknown created dates
+    edges = data_manager.data.head(8).copy()
+    edges["Short description"] = edges["Short description"].astype(object)
+    edges.iloc[0, edges.columns.get_loc("Short description")] = None
+    edges.iloc[1, edges.columns.get_loc("Short description")] = "x" * 80
+    edges.iloc[2, edges.columns.get_loc("Short description")] = "   "
+    edges["Category"] = edges["Category"].astype(object)
+    edges["Subcategory"] = edges["Subcategory"].astype(object)
+    edges.iloc[3, edges.columns.get_loc("Category")] = None
+    edges.iloc[4, edges.columns.get_loc("Subcategory")] = ""
+    edges["Resolution_Hours"] = [0.5, 0.0, np.nan, 30.0, 23.99, 200.0, -1.0, 5.0]
+    edges.iloc[5, edges.columns.get_loc("Resolved")] = pd.NaT
+    edges.iloc[6, edges.columns.get_loc("Created")] = pd.NaT
+    
+    frames = [
+        data_manager.data,
+        data_manager.apply_filters({"resolution_status": "Open"}),
+        edges,
+        edges.drop(columns=["Number", "Short description", "Subcategory", "Resolved"])
+    ]
+    for frame in frames:
+        results, _ = report_engine.generate_incident_details_report(frame)
+        assert results == _incident_details_row_by_row(frame)
+    
+    print(f"  - Compared {sum(len(frame) for frame in frames)} tickets")
+    print("✓ Incident details tested successfully!")
+
 def test_filtering(data_manager):
     """Test filtering functionality"""
     print("\nTesting filtering...")
@@ -126,22 +350,116 @@ def test_filtering(data_manager):
     
     print("✓ Filtering tested successfully!")
 
+def _filter_with_masks(df, filters):
+    """Reference filtering with one boolean mask per filter"""
+    if filters.get("date_from"):
+        df = df[df["Created"] >= pd.to_datetime(filters["date_from"])]
+    if filters.get("date_to"):
+        df = df[df["Created"] <= pd.to_datetime(filters["date_to"])]
+    if filters.get("priorities"):
+        df = df[df["Priority"].isin(filters["priorities"])]
+    for key, column in (("company", "Company"), ("site", "Site"), ("category", "Category"), ("subcategory", "Subcategory")):
+        if filters.get(key) and filters[key] != "All":
+            df = df[df[column] == filters[key]]
+    if filters.get("resolution_status") == "Open":
+        df = df[df["Is_Resolved"] == False]
+    elif filters.get("resolution_status") == "Resolved":
+        df = df[df["Is_Resolved"] == True]
+    return df
+
+def test_filter_index(data_manager):
+    """Test that indexed filtering matches boolean-mask filtering for every filter combination"""
+    print("\nTesting indexed filtering...")
+    
+    data = data_manager.data
+    company = data["Company"].iloc[0]
+    site = data.loc[data["Company"] == company, "Site"].iloc[0]
+    other_site = data.loc[data["Company"] != company, "Site"].iloc[0]
+    category = data["Category"].iloc[0]
+    subcategory = data_manager.get_subcategories(category)[0]
+    middle = data["Created"].sort_values().iloc[len(data) // 2].strftime("%Y-%m-%d")
+    
+    options = {
+        "priorities": [None, ["1 - Critical", "3 - Medium", "Unknown"]],
+        "company": ["All", company, "Unknown"],
+        "site": [None, site, other_site],
+        "category": [None, category],
+        "subcategory": [None, subcategory]
+    }
+    # The date and status filters are applied after the indexed ones
+    later_filters = [
+        {},
+        {"date_from": middle, "resolution_status": "Open"},
+        {"date_to": middle, "resolution_status": "Resolved"}
+    ]
+    combinations = 0
+    for values in itertools.product(*options.values()):
+        for later in later_filters:
+            filters = {**dict(zip(options, values)), **later}
+            expected = _filter_with_masks(data, filters)
+            pd.testing.assert_frame_equal(data_manager.apply_filters(filters), expected)
+            combinations += 1
+    
+    # Unfiltered results are copies, so changing them leaves the loaded data alone
+    unfiltered = data_manager.apply_filters({})
+    unfiltered["Extra"] = 1
+    assert "Extra" not in data_manager.data.columns
+    
+    print(f"  - Compared {combinations} filter combinations")
+    print("✓ Indexed filtering tested successfully!")
+
+def test_csv_export():
+    """Test that CSV exports are written exactly as pandas' to_csv writes them"""
+    print("\nTesting CSV export...")
+    
+    frame = pd.DataFrame({
+        "Site": pd.Categorical(["Store 1", "Store 2", None]),
+        "Number": [1, 2, 3],
+        "Hours": [1.5, np.nan, 1e-05],
+        "Is_Critical": [True, False, True],
+        "Created": pd.to_datetime(["2025-01-01 10:00:00", "2025-01-02 00:00:01", None]),
+        "Resolved": pd.to_datetime(["2025-04-12", "2025-04-23", None]),  # All at midnight: written as dates
+        "Label": ["plain", "", None],
+        "Notes": ["a, b", 'said "hi"', "two\nlines"]
+    })
+    exporter = DataExporter()
+    
+    # Without Notes every value can be written unquoted; with it, values need quoting
+    for columns in (list(frame.columns[:-1]), list(frame.columns)):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "export.csv")
+            exporter.write_csv(frame[columns], path)
+            with open(path, encoding="utf-8", newline="") as f:
+                assert f.read() == frame[columns].to_csv(index=False), columns
+    
+    print("✓ CSV export tested successfully!")
+
 def main():
     """Run all tests"""
     print("IT Stability Monitor - Component Tests")
     print("=" * 50)
     
+    # Test settings
+    test_settings()
+    
     # Test data loading
+    test_date_parsing()
     success, data_manager = test_data_loading()
     if not success:
         print("Data loading test failed. Exiting.")
         return False
+    test_data_cache()
     
     # Test reports
     test_reports(data_manager)
+    test_incident_details(data_manager)
     
     # Test filtering
     test_filtering(data_manager)
+    test_filter_index(data_manager)
+    
+    # Test exports
+    test_csv_export()
     
     print("\n" + "=" * 50)
     print("All tests completed successfully! 🎉")